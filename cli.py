@@ -199,8 +199,8 @@ def compute(args):
 
             elif rune_key == "conqueror":
                 bonus = rune.stat_bonus(fiora.level, stacks=12, adaptive="ad")
-                rune_out["max_stacks_bonus_AD"] = bonus["bonus_AD"]
-                rune_out["per_stack_AD"] = bonus["per_stack_AD"]
+                rune_out["max_stacks_bonus_AD"] = round(bonus["bonus_AD"], 2)
+                rune_out["per_stack_AD"] = round(bonus["per_stack_AD"], 2)
                 # Q damage with max stacks
                 fiora.add_stats(bonus_AD=bonus["bonus_AD"])
                 q_data = fiora.Q()
@@ -208,7 +208,7 @@ def compute(args):
                     q_conq = calculate_damage(q_data, target, champion=fiora)
                     rune_out["q_at_max_stacks"] = q_conq["total_damage"]
                     heal = rune.healing(q_conq["post_mitigation_damage"], is_melee=True)
-                    rune_out["heal_from_q"] = heal["heal"]
+                    rune_out["heal_from_q"] = round(heal["heal"], 2)
                 fiora.add_stats(bonus_AD=-bonus["bonus_AD"])
 
             elif rune_key == "hob":
@@ -224,7 +224,7 @@ def compute(args):
                 perm = rune.permanent_hp(is_melee=True)
                 rune_out["proc_damage"] = proc_dmg["total_damage"]
                 rune_out["proc_type"] = "magic"
-                rune_out["heal"] = heal["heal"]
+                rune_out["heal"] = round(heal["heal"], 2)
                 rune_out["permanent_hp"] = perm["permanent_hp"]
 
             result["rune"] = rune_out
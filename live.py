@@ -27,7 +27,7 @@ from lol_champions.runes import (
 )
 from lol_champions.items import SpearOfShojin
 from lol_champions.live_client import (
-    is_game_active, get_active_player, get_player_list, get_game_stats,
+    is_game_active, snapshot_sync,
 )
 from lol_champions.data_dragon import DataDragon
 
@@ -712,9 +712,10 @@ def main():
                 print("Game detected!")
 
             try:
-                player_data = get_active_player()
-                player_list = get_player_list()
-                game_stats = get_game_stats()
+                snap = snapshot_sync()
+                player_data = snap["active_player"]
+                player_list = snap["player_list"]
+                game_stats = snap["game_stats"]
             except Exception:
                 time.sleep(args.interval)
                 continue
@@ -2,13 +2,14 @@
 
 from .champion import Champion
 from .ability import Ability
-from .fiora import Fiora
+from .fiora import Fiora, BoundFiora
 from .target import Target
 from .damage import calculate_damage, calculate_combo, effective_resistance, damage_after_mitigation
+from .damage import ProcResult, RuneProc, DamageResult, DmgType
 from .runes import PressTheAttack, Conqueror, HailOfBlades, GraspOfTheUndying
 from .runes import LastStand, CoupDeGrace, CutDown
 from .items import (
-    SpearOfShojin,
+    SpearOfShojin, FlatOnHit,
     # On-hit
     BladeOfTheRuinedKing, WitsEnd, NashorsTooth, RecurveBow, Terminus, TitanicHydra,
     # Stacking on-hit
@@ -27,21 +28,30 @@ from .items import (
     SunderedSky, DeadMansPlate,
     # Misc
     Tiamat, GuinsoosRageblade,
+    get_item, build_item_modifiers,
 )
+from .items_soa import build_item_arrays, proc_all, proc_damage_vec
+from .items_codegen import compile_build, proc_build_quantized
 from .dps import optimize_dps
 from .build_optimizer import optimize_build, ITEM_CATALOG, ITEM_ID_TO_PROC, validate_catalog
-from .logger import log_result, log_build_results
-from .live_client import is_game_active, get_active_player, get_player_list, get_game_stats
+from .logger import (
+    log_result, log_result_by_names, log_result_by_instances, log_build_results,
+)
+from .live_client import (
+    is_game_active, get_active_player, get_player_list, get_game_stats,
+    snapshot, snapshot_sync,
+)
 from .data_dragon import DataDragon
 
 __all__ = [
-    'Champion', 'Ability', 'Fiora',
+    'Champion', 'Ability', 'Fiora', 'BoundFiora',
     'Target',
     'calculate_damage', 'calculate_combo', 'effective_resistance', 'damage_after_mitigation',
+    'ProcResult', 'RuneProc', 'DamageResult', 'DmgType',
     'PressTheAttack', 'Conqueror', 'HailOfBlades', 'GraspOfTheUndying',
     'LastStand', 'CoupDeGrace', 'CutDown',
     # Items
-    'SpearOfShojin',
+    'SpearOfShojin', 'FlatOnHit',
     'BladeOfTheRuinedKing', 'WitsEnd', 'NashorsTooth', 'RecurveBow', 'Terminus', 'TitanicHydra',
     'KrakenSlayer',
     'TrinityForce', 'IcebornGauntlet', 'LichBane',
@@ -51,10 +61,15 @@ __all__ = [
     'LiandrysTorment', 'SunfireAegis', 'HollowRadiance',
     'SunderedSky', 'DeadMansPlate',
     'Tiamat', 'GuinsoosRageblade',
+    'get_item', 'build_item_modifiers',
+    'build_item_arrays', 'proc_all', 'proc_damage_vec',
+    'compile_build', 'proc_build_quantized',
     'optimize_dps',
     'optimize_build', 'ITEM_CATALOG', 'ITEM_ID_TO_PROC', 'validate_catalog',
-    'log_result', 'log_build_results',
+    'log_result', 'log_result_by_names', 'log_result_by_instances',
+    'log_build_results',
     'is_game_active', 'get_active_player', 'get_player_list', 'get_game_stats',
+    'snapshot', 'snapshot_sync',
     'DataDragon',
 ]
 __version__ = '1.6.0'
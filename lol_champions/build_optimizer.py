@@ -10,7 +10,11 @@ with a DataDragon instance to detect patch-drift on the stats DDragon
 can verify (AD, HP, AS, armor, MR, AP).
 """
 
+import functools
+import heapq
 import itertools
+import math
+import operator
 import sys
 from collections import defaultdict
 from typing import Any, Dict, List
@@ -29,6 +33,7 @@ from .items import (
     LiandrysTorment, SunfireAegis, HollowRadiance,
     SunderedSky, DeadMansPlate,
     Tiamat, GuinsoosRageblade,
+    get_item,
 )
 
 
@@ -339,8 +344,8 @@ def _is_valid_combo(item_names: tuple) -> bool:
     return True
 
 
-def _apply_build(champion, item_names) -> tuple:
-    """Apply item stats to champion and return (combined_stats, proc_instances)."""
+def _build_stats(item_names) -> tuple:
+    """Return (combined_stats, proc_instances) for a build, without applying it."""
     combined: Dict[str, float] = {}
     procs: list = []
     for name in item_names:
@@ -348,15 +353,53 @@ def _apply_build(champion, item_names) -> tuple:
         for stat, val in entry["stats"].items():
             combined[stat] = combined.get(stat, 0) + val
         if entry.get("proc"):
-            procs.append(entry["proc"]())
-    champion.add_stats(**combined)
+            procs.append(get_item(name))
     return combined, procs
 
 
-def _undo_build(champion, stats_applied: dict):
-    """Remove previously applied item stats from champion."""
-    negated = {k: -v for k, v in stats_applied.items()}
-    champion.add_stats(**negated)
+def _snapshot_stats(champion, stats: dict) -> dict:
+    """Current values of the champion attributes *stats* will modify."""
+    return {k: getattr(champion, k) for k in stats}
+
+
+def _restore_stats(champion, saved: dict):
+    """Put back attributes captured by _snapshot_stats() and refresh totals.
+
+    Restoring the saved values (rather than adding negated stats) leaves the
+    champion bit-identical after every build, so float error cannot
+    accumulate over thousands of apply/undo cycles.
+    """
+    for k, v in saved.items():
+        setattr(champion, k, v)
+    champion._refresh_totals()
+
+
+def _pool_tables(pool) -> tuple:
+    """Per-item tables for a search pool, aligned with *pool*.
+
+    Returns (fields, rows, group_masks, has_proc):
+      fields      - stat names present in the pool
+      rows        - one tuple of stat values per item, aligned with fields
+      group_masks - bitmask of each item's exclusive groups
+      has_proc    - whether each item has a proc dataclass
+    """
+    fields = list(dict.fromkeys(
+        stat for name in pool for stat in ITEM_CATALOG[name]["stats"]
+    ))
+    rows = []
+    group_masks = []
+    has_proc = []
+    group_bits: Dict[str, int] = {}
+    for name in pool:
+        entry = ITEM_CATALOG[name]
+        stats = entry["stats"]
+        rows.append(tuple(stats.get(f, 0) for f in fields))
+        mask = 0
+        for g in entry.get("exclusive", []):
+            mask |= group_bits.setdefault(g, 1 << len(group_bits))
+        group_masks.append(mask)
+        has_proc.append(bool(entry.get("proc")))
+    return fields, rows, group_masks, has_proc
 
 
 def _resolve_pool(pool=None, exclude=None) -> list:
@@ -376,10 +419,15 @@ def _resolve_pool(pool=None, exclude=None) -> list:
 # ═══════════════════════════════════════════════════════════════════════
 
 
-def _evaluate_build(champion, target, item_names, time_limit,
-                    rune, damage_modifiers, r_active) -> dict:
-    """Score a single build: apply stats, run optimizer, undo, return result."""
-    stats, procs = _apply_build(champion, item_names)
+def _run_build(champion, target, item_names, stats, procs, time_limit,
+               rune, damage_modifiers, r_active) -> dict:
+    """Apply precomputed build stats, run optimizer, undo, return result.
+
+    The same champion instance is reused for every build in a search; only
+    the stats a build touches are saved and restored around it.
+    """
+    saved = _snapshot_stats(champion, stats)
+    champion.add_stats(**stats)
     try:
         result = optimize_dps(
             champion=champion,
@@ -391,7 +439,7 @@ def _evaluate_build(champion, target, item_names, time_limit,
             r_active=r_active,
         )
     finally:
-        _undo_build(champion, stats)
+        _restore_stats(champion, saved)
     return {
         "items": list(item_names),
         "total_damage": result["total_damage"],
@@ -403,32 +451,55 @@ def _evaluate_build(champion, target, item_names, time_limit,
     }
 
 
+def _evaluate_build(champion, target, item_names, time_limit,
+                    rune, damage_modifiers, r_active) -> dict:
+    """Score a single build: apply stats, run optimizer, undo, return result."""
+    stats, procs = _build_stats(item_names)
+    return _run_build(champion, target, item_names, stats, procs, time_limit,
+                      rune, damage_modifiers, r_active)
+
+
 def _exhaustive_search(champion, target, pool, item_count, time_limit,
                        rune, damage_modifiers, r_active, top_n,
                        progress=True) -> list:
     """Try every valid combination and return top N by DPS."""
-    results = []
-    total = 0
+    # Bounded min-heap of (dps, -combo_number, result): the worst kept build
+    # is at top[0]. The negated counter makes the earlier build win a DPS tie,
+    # like the stable sort this replaces.
+    top: list = []
     valid = 0
 
-    # Count total combos for progress reporting
-    all_combos = list(itertools.combinations(pool, item_count))
-    total_combos = len(all_combos)
+    # Combos are enumerated as index tuples into per-item tables, so
+    # validity is a bitmask test and stats are column sums — no catalog
+    # dict lookups per combo.
+    fields, rows, group_masks, has_proc = _pool_tables(pool)
+    total_combos = math.comb(len(pool), item_count)
 
     best_dps = 0.0
     best_items = []
 
-    for i, combo in enumerate(all_combos):
-        total += 1
-        if not _is_valid_combo(combo):
+    for idx in itertools.combinations(range(len(pool)), item_count):
+        # Exclusive groups clash iff two masks share a bit, i.e. iff their
+        # sum differs from their bitwise OR.
+        masks = [group_masks[i] for i in idx]
+        if sum(masks) != functools.reduce(operator.or_, masks, 0):
             continue
         valid += 1
 
-        result = _evaluate_build(
-            champion, target, combo, time_limit,
+        combo = [pool[i] for i in idx]
+        sums = map(sum, zip(*[rows[i] for i in idx]))
+        stats = {f: v for f, v in zip(fields, sums) if v}
+        procs = [get_item(pool[i]) for i in idx if has_proc[i]]
+
+        result = _run_build(
+            champion, target, combo, stats, procs, time_limit,
             rune, damage_modifiers, r_active,
         )
-        results.append(result)
+        entry = (result["dps"], -valid, result)
+        if len(top) < top_n:
+            heapq.heappush(top, entry)
+        elif top and entry[:2] > top[0][:2]:
+            heapq.heapreplace(top, entry)
 
         if result["dps"] > best_dps:
             best_dps = result["dps"]
@@ -439,8 +510,7 @@ def _exhaustive_search(champion, target, pool, item_count, time_limit,
             print(f"  [{valid}/{total_combos}] Best: {names} = {best_dps} DPS",
                   file=sys.stderr, flush=True)
 
-    results.sort(key=lambda r: r["dps"], reverse=True)
-    return results[:top_n]
+    return [result for _, _, result in sorted(top, key=lambda e: e[:2], reverse=True)]
 
 
 def _greedy_search(champion, target, pool, item_count, time_limit,
@@ -449,6 +519,7 @@ def _greedy_search(champion, target, pool, item_count, time_limit,
     """Greedy iterative: pick the best item for each slot sequentially."""
     chosen: list = []
     remaining = list(pool)
+    final = None
 
     for slot in range(item_count):
         best_result = None
@@ -473,20 +544,17 @@ def _greedy_search(champion, target, pool, item_count, time_limit,
 
         chosen.append(best_name)
         remaining.remove(best_name)
+        # best_result was scored on exactly ``chosen`` — it is the final
+        # build's result if no later slot is filled.
+        final = best_result
 
         if progress:
             names = " + ".join(chosen)
             print(f"  Slot {slot + 1}/{item_count}: {names} = "
                   f"{best_result['dps']} DPS", file=sys.stderr, flush=True)
 
-    # Final evaluation with the complete build
-    if not chosen:
+    if final is None:
         return []
-
-    final = _evaluate_build(
-        champion, target, tuple(chosen), time_limit,
-        rune, damage_modifiers, r_active,
-    )
     return [final]
 
 
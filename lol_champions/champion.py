@@ -71,13 +71,23 @@ class Champion:
     total_AR: float = field(init=False)
     total_MR: float = field(init=False)
 
+    # Per-level stat growth multiplier (0.65 + 0.035 * level), by level
+    _LEVEL_MULT = tuple(0.65 + 0.035 * lvl for lvl in range(21))
+
     def __post_init__(self):
         """Calculate total stats after initialization."""
-        self.total_AD = self.base_AD + self.bonus_AD
-        self.total_AP = self.base_AP + self.bonus_AP
-        self.total_HP = self.base_HP + self.bonus_HP
-        self.total_AR = self.base_AR + self.bonus_AR
-        self.total_MR = self.base_MR + self.bonus_MR
+        self._refresh_totals()
+
+    def _refresh_totals(self):
+        """Recompute total_* stats from base + bonus in one assignment."""
+        (self.total_AD, self.total_AP, self.total_HP,
+         self.total_AR, self.total_MR) = (
+            self.base_AD + self.bonus_AD,
+            self.base_AP + self.bonus_AP,
+            self.base_HP + self.bonus_HP,
+            self.base_AR + self.bonus_AR,
+            self.base_MR + self.bonus_MR,
+        )
 
     @staticmethod
     def scaling_value(new_level: int, value: float) -> float:
@@ -106,16 +116,17 @@ class Champion:
         if self.level < self.max_level:
             self.level += 1
             self.skill_points += 1
-            self.base_AD += self.scaling_value(self.level, self.AD_scaling)
-            self.base_AP += self.scaling_value(self.level, self.AP_scaling)
-            self.base_HP += self.scaling_value(self.level, self.HP_scaling)
-            self.base_AR += self.scaling_value(self.level, self.AR_scaling)
-            self.base_MR += self.scaling_value(self.level, self.MR_scaling)
-            self.total_AD = self.base_AD + self.bonus_AD
-            self.total_AP = self.base_AP + self.bonus_AP
-            self.total_HP = self.base_HP + self.bonus_HP
-            self.total_AR = self.base_AR + self.bonus_AR
-            self.total_MR = self.base_MR + self.bonus_MR
+            # Same as scaling_value(), with the multiplier from the table
+            if self.level < len(self._LEVEL_MULT):
+                mult = self._LEVEL_MULT[self.level]
+            else:
+                mult = 0.65 + 0.035 * self.level
+            self.base_AD += round(self.AD_scaling * mult, 2)
+            self.base_AP += round(self.AP_scaling * mult, 2)
+            self.base_HP += round(self.HP_scaling * mult, 2)
+            self.base_AR += round(self.AR_scaling * mult, 2)
+            self.base_MR += round(self.MR_scaling * mult, 2)
+            self._refresh_totals()
             print(f"Level up! Now level {self.level}. Skill points: {self.skill_points}")
         else:
             print("Champion is already at max level.")
@@ -138,10 +149,14 @@ class Champion:
         """Time in seconds for the attack windup animation."""
         return round(self.attack_interval(extra_bonus_as_pct) * self.windup_pct, 4)
 
-    def auto_attack(self) -> Dict[str, Union[float, str]]:
-        """Basic attack dealing total AD as physical damage."""
+    def auto_attack(self, rounded: bool = True) -> Dict[str, Union[float, str]]:
+        """Basic attack dealing total AD as physical damage.
+
+        Args:
+            rounded: Round damage to 2 decimals (False keeps full precision)
+        """
         return {
-            "raw_damage": round(self.total_AD, 2),
+            "raw_damage": round(self.total_AD, 2) if rounded else self.total_AD,
             "damage_type": "physical",
         }
 
@@ -182,8 +197,6 @@ class Champion:
         self.life_steal += life_steal
         self.omnivamp += omnivamp
         self.health_regen_per_sec += health_regen_per_sec
-        self.total_AD = self.base_AD + self.bonus_AD
-        self.total_AP = self.base_AP + self.bonus_AP
-        self.total_HP = self.base_HP + self.bonus_HP
-        self.total_AR = self.base_AR + self.bonus_AR
-        self.total_MR = self.base_MR + self.bonus_MR
+        # Always recompute, so totals left stale by direct base_*/bonus_*
+        # assignment are fixed by the next add_stats() call
+        self._refresh_totals()
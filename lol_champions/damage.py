@@ -3,12 +3,99 @@
 All formulas sourced from https://wiki.leagueoflegends.com/en-us/
 """
 
-from typing import Dict, Any, List
+import functools
+from enum import IntEnum
+from typing import Dict, Any, List, NamedTuple, Tuple
 
 
 # Type alias for dicts returned by champion ability methods and rune procs
 AbilityData = Dict[str, Any]
 
+PHYSICAL = "physical"
+MAGIC = "magic"
+TRUE = "true"
+
+
+class DmgType(IntEnum):
+    """Integer ids for damage types, for compact storage (e.g. SoA columns).
+
+    Result dicts keep the string names; convert with ``DAMAGE_TYPE_NAMES``
+    and ``DAMAGE_TYPE_IDS``.  ``calculate_damage()`` accepts either form.
+    """
+    PHYSICAL = 0
+    MAGIC = 1
+    TRUE = 2
+
+
+# DmgType → string name, and string name → DmgType
+DAMAGE_TYPE_NAMES = (PHYSICAL, MAGIC, TRUE)
+DAMAGE_TYPE_IDS = {name: DmgType(i) for i, name in enumerate(DAMAGE_TYPE_NAMES)}
+
+
+class ProcResult(NamedTuple):
+    """Raw damage of one item proc, as returned by item ``proc_damage()``.
+
+    A named tuple rather than a dict.  Key access (``proc["raw_damage"]``,
+    ``proc.get("damage_type")``, ``"raw_damage" in proc``) still works, so
+    it can be passed anywhere an ability dict is accepted.
+    """
+    raw_damage: float
+    damage_type: str
+
+    def __getitem__(self, key):
+        if key.__class__ is str:
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key) -> bool:
+        return key in self._fields
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self._fields else default
+
+    def keys(self):
+        return self._fields
+
+
+class RuneProc(NamedTuple):
+    """Raw damage of a keystone proc with a cooldown (Press the Attack).
+
+    Supports the same key access as ``ProcResult``.
+    """
+    raw_damage: float
+    damage_type: str
+    cooldown: float
+
+    __getitem__ = ProcResult.__getitem__
+    __contains__ = ProcResult.__contains__
+    get = ProcResult.get
+    keys = ProcResult.keys
+
+
+class DamageResult(NamedTuple):
+    """Result of ``calculate_damage()``.
+
+    Fields are read as attributes (``result.total_damage``); key access
+    (``result["total_damage"]``, ``result.get(...)``) still works as for
+    ``ProcResult``.  Use ``result._asdict()`` to serialize.
+    """
+    raw_damage: float
+    damage_type: str
+    effective_resistance: float
+    post_mitigation_damage: float
+    damage_reduction_pct: float
+    damage_amp: float
+    damage_modifiers: list
+    total_amp_multiplier: float
+    total_damage: float
+
+    __getitem__ = ProcResult.__getitem__
+    __contains__ = ProcResult.__contains__
+    get = ProcResult.get
+    keys = ProcResult.keys
+
 
 # ─── LOW-LEVEL FUNCTIONS (pure math, no object dependencies) ───
 
@@ -76,6 +163,45 @@ def damage_after_mitigation(raw_damage: float, resistance: float) -> float:
     return round(raw_damage * multiplier, 2)
 
 
+@functools.lru_cache(maxsize=4096)
+def _mitigation(resistance: float, flat_reduction: float, pct_reduction: float,
+                pct_penetration: float, flat_penetration: float) -> Tuple[float, float]:
+    """(effective_resistance, damage multiplier) for one resistance setup.
+
+    Cached: within a calculation the same target/champion resistances
+    recur for every ability and proc of a damage type.
+    """
+    eff = effective_resistance(resistance, flat_reduction, pct_reduction,
+                               pct_penetration, flat_penetration)
+    if eff >= 0:
+        return eff, 100.0 / (100.0 + eff)
+    return eff, 2.0 - 100.0 / (100.0 - eff)
+
+
+def _physical_resistance(target, champion) -> Tuple[float, float, float]:
+    """(armor, % armor pen, lethality) for a physical hit."""
+    if champion is None:
+        return target.armor, 0.0, 0.0
+    return (target.armor, getattr(champion, 'armor_pen_pct', 0.0),
+            getattr(champion, 'lethality', 0.0))
+
+
+def _magic_resistance(target, champion) -> Tuple[float, float, float]:
+    """(MR, % magic pen, flat magic pen) for a magic hit."""
+    if champion is None:
+        return target.mr, 0.0, 0.0
+    return (target.mr, getattr(champion, 'magic_pen_pct', 0.0),
+            getattr(champion, 'magic_pen_flat', 0.0))
+
+
+# Damage type → (resistance, % pen, flat pen) lookup; None = true damage.
+_RESISTANCE_SOURCES = {
+    PHYSICAL: _physical_resistance,
+    MAGIC: _magic_resistance,
+    TRUE: None,
+}
+
+
 def resolve_adaptive_type(bonus_ad: float, bonus_ap: float) -> str:
     """Determine adaptive damage type based on higher bonus stat.
 
@@ -100,10 +226,13 @@ def calculate_damage(
     flat_reduction: float = 0.0,
     pct_reduction: float = 0.0,
     damage_modifiers: List[Dict[str, Any]] = None,
-) -> Dict[str, Any]:
+) -> DamageResult:
     """Calculate post-mitigation damage for an ability against a target.
 
     Reads 'raw_damage' and 'damage_type' from ability_data dict.
+    ``damage_type`` may be a string name, a ``DmgType`` or its int value;
+    the resistance and penetration stats are picked through a per-type
+    lookup table.
     Reads penetration stats from champion if provided.
     Applies mitigation from target's armor/MR.
     Applies optional damage_amp and damage_modifiers as multipliers.
@@ -114,7 +243,8 @@ def calculate_damage(
 
     Args:
         ability_data: Dict returned by champion ability method (must have
-                      'raw_damage' and 'damage_type' keys)
+                      'raw_damage' and 'damage_type' keys), an item
+                      ``ProcResult`` or a rune ``RuneProc``
         target: Target instance with armor/mr stats
         champion: Optional Champion with penetration stats (lethality,
                   armor_pen_pct, magic_pen_flat, magic_pen_pct)
@@ -126,21 +256,31 @@ def calculate_damage(
                           multiplicatively.
 
     Returns:
-        Dict with: raw_damage, damage_type, effective_resistance,
+        DamageResult with: raw_damage, damage_type, effective_resistance,
         post_mitigation_damage, damage_reduction_pct, damage_amp,
-        damage_modifiers, total_amp_multiplier, total_damage
+        damage_modifiers, total_amp_multiplier, total_damage.  Supports
+        dict-style reads; call ``_asdict()`` before serializing (JSON
+        encodes a named tuple as a bare list).
 
     Raises:
-        ValueError: If ability_data is missing required keys
+        ValueError: If ability_data is missing required keys, or its
+                    damage_type is not a known damage type
     """
-    if "raw_damage" not in ability_data:
-        raise ValueError(
-            "ability_data must contain 'raw_damage' key. "
-            "Got keys: " + str(list(ability_data.keys()))
-        )
-
-    raw_damage = ability_data["raw_damage"]
-    damage_type = ability_data.get("damage_type", "physical")
+    cls = ability_data.__class__
+    if cls is ProcResult:
+        raw_damage, damage_type = ability_data
+    elif cls is RuneProc:
+        raw_damage, damage_type, _ = ability_data
+    else:
+        if "raw_damage" not in ability_data:
+            raise ValueError(
+                "ability_data must contain 'raw_damage' key. "
+                "Got keys: " + str(list(ability_data.keys()))
+            )
+        raw_damage = ability_data["raw_damage"]
+        damage_type = ability_data.get("damage_type", "physical")
+    if damage_type.__class__ is not str:
+        damage_type = DAMAGE_TYPE_NAMES[DmgType(damage_type)]
 
     # Resolve adaptive damage type
     if damage_type == "adaptive" and champion is not None:
@@ -148,31 +288,22 @@ def calculate_damage(
     elif damage_type == "adaptive":
         damage_type = "physical"
 
+    try:
+        resistance_source = _RESISTANCE_SOURCES[damage_type]
+    except KeyError:
+        raise ValueError(f"Unknown damage_type: {damage_type!r}") from None
     # True damage bypasses everything
-    if damage_type == "true":
+    if resistance_source is None:
         post_mitigation = raw_damage
         eff_resistance = 0.0
         reduction_pct = 0.0
     else:
-        # Determine which resistance applies
-        if damage_type == "physical":
-            resistance = target.armor
-            pct_pen = getattr(champion, 'armor_pen_pct', 0.0) if champion else 0.0
-            flat_pen = getattr(champion, 'lethality', 0.0) if champion else 0.0
-        else:  # magic
-            resistance = target.mr
-            pct_pen = getattr(champion, 'magic_pen_pct', 0.0) if champion else 0.0
-            flat_pen = getattr(champion, 'magic_pen_flat', 0.0) if champion else 0.0
-
-        eff_resistance = effective_resistance(
-            resistance,
-            flat_reduction=flat_reduction,
-            pct_reduction=pct_reduction,
-            pct_penetration=pct_pen,
-            flat_penetration=flat_pen,
+        resistance, pct_pen, flat_pen = resistance_source(target, champion)
+        eff_resistance, mitigation = _mitigation(
+            resistance, flat_reduction, pct_reduction, pct_pen, flat_pen,
         )
 
-        post_mitigation = damage_after_mitigation(raw_damage, eff_resistance)
+        post_mitigation = round(raw_damage * mitigation, 2)
         reduction_pct = round(
             (1.0 - post_mitigation / raw_damage) * 100, 2
         ) if raw_damage > 0 else 0.0
@@ -185,17 +316,10 @@ def calculate_damage(
         multiplier *= (1.0 + mod.get("amp", 0.0))
     total_damage = round(post_mitigation * multiplier, 2)
 
-    return {
-        "raw_damage": raw_damage,
-        "damage_type": damage_type,
-        "effective_resistance": eff_resistance,
-        "post_mitigation_damage": post_mitigation,
-        "damage_reduction_pct": reduction_pct,
-        "damage_amp": damage_amp,
-        "damage_modifiers": mods,
-        "total_amp_multiplier": round(multiplier, 4),
-        "total_damage": total_damage,
-    }
+    return DamageResult(
+        raw_damage, damage_type, eff_resistance, post_mitigation,
+        reduction_pct, damage_amp, mods, round(multiplier, 4), total_damage,
+    )
 
 
 # ─── COMBO CALCULATOR ───
@@ -255,7 +379,7 @@ def calculate_combo(
         Dict with per-step breakdown, totals, and healing.
     """
     from .runes import PressTheAttack, Conqueror, GraspOfTheUndying
-    from .items import SpearOfShojin
+    from .items import SpearOfShojin, action_id
 
     # Rune state
     pta_hits = 0
@@ -280,6 +404,7 @@ def calculate_combo(
     try:
         for step_name in steps:
             step = step_name.upper()
+            step_id = action_id(step)
             is_on_hit = step in ON_HIT_STEPS
 
             # --- Conqueror: apply bonus AD once fully stacked ---
@@ -301,7 +426,7 @@ def calculate_combo(
             # Shojin: triggering ability does NOT benefit from its own stack.
             # Apply current stacks first, then grant the new stack after.
             step_mods = list(static_mods)  # copy
-            if shojin and SpearOfShojin.is_amplified(step):
+            if shojin and SpearOfShojin.is_amplified(step_id):
                 step_mods.append(shojin.modifier_dict())
 
             dmg = calculate_damage(
@@ -310,15 +435,15 @@ def calculate_combo(
             )
 
             # Grant Shojin stack AFTER damage is calculated
-            if shojin and SpearOfShojin.grants_stack(step):
+            if shojin and SpearOfShojin.grants_stack(step_id):
                 shojin.add_stack()
 
             entry = {
                 "step": step,
-                "raw_damage": dmg["raw_damage"],
-                "damage_type": dmg["damage_type"],
-                "post_mitigation": dmg["total_damage"],
-                "amp_multiplier": dmg["total_amp_multiplier"],
+                "raw_damage": dmg.raw_damage,
+                "damage_type": dmg.damage_type,
+                "post_mitigation": dmg.total_damage,
+                "amp_multiplier": dmg.total_amp_multiplier,
             }
             if shojin:
                 entry["shojin_stacks"] = shojin.stacks
@@ -335,7 +460,7 @@ def calculate_combo(
                 if pta_hits == 3 and not pta_exposed:
                     proc = rune.proc_damage(champion.level, champion.bonus_AD, champion.bonus_AP)
                     proc_dmg = calculate_damage(proc, target, champion=champion)
-                    entry["pta_proc"] = proc_dmg["total_damage"]
+                    entry["pta_proc"] = proc_dmg.total_damage
                     pta_exposed = True
 
             # --- Conqueror tracking ---
@@ -344,8 +469,8 @@ def calculate_combo(
                 entry["conq_stacks"] = conq_stacks
                 # Heal at max stacks
                 if conq_stacks == rune.max_stacks:
-                    heal = rune.healing(dmg["post_mitigation_damage"], is_melee=champion.is_melee)
-                    entry["conq_heal"] = heal["heal"]
+                    heal = rune.healing(dmg.post_mitigation_damage, is_melee=champion.is_melee)
+                    entry["conq_heal"] = round(heal["heal"], 2)
                     total_healing += heal["heal"]
 
             # --- Grasp tracking ---
@@ -353,8 +478,8 @@ def calculate_combo(
                 proc = rune.proc_damage(champion.total_HP, is_melee=champion.is_melee)
                 proc_dmg = calculate_damage(proc, target, champion=champion)
                 heal = rune.healing(champion.total_HP, is_melee=champion.is_melee)
-                entry["grasp_proc"] = proc_dmg["total_damage"]
-                entry["grasp_heal"] = heal["heal"]
+                entry["grasp_proc"] = proc_dmg.total_damage
+                entry["grasp_heal"] = round(heal["heal"], 2)
                 total_healing += heal["heal"]
                 grasp_available = False
 
@@ -16,12 +16,14 @@ Timing model:
   - Vital respawn: 2.25s after proc (0.5s identify + 1.75s targetable)
 """
 
-import copy
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Tuple
 
-from .damage import calculate_damage
-from .items import ON_HIT_ACTIONS, ABILITY_CAST_ACTIONS, ABILITY_DAMAGE_ACTIONS
+from .damage import _mitigation, calculate_damage
+from .items import (
+    ON_HIT_ACTIONS, ACTION_IDS,
+    ON_HIT_MASK, ABILITY_CAST_MASK, ABILITY_DAMAGE_MASK,
+)
 
 
 # ─── STATE ───
@@ -89,7 +91,10 @@ class DPSState:
     actions: list = field(default_factory=list)
 
     def copy(self) -> 'DPSState':
-        new = copy.copy(self)
+        # Direct __dict__ copy — skips copy.copy()'s generic reduce protocol,
+        # which dominated per-node cost in the search.
+        new = object.__new__(DPSState)
+        new.__dict__.update(self.__dict__)
         new.actions = list(self.actions)
         return new
 
@@ -99,7 +104,14 @@ class DPSState:
 
 @dataclass
 class DamageTable:
-    """Pre-computed damage values for every action under each rune condition."""
+    """Pre-computed damage values for every action under each rune condition.
+
+    Built once per search by ``build_damage_table()``: every item proc that
+    is closed-form in champion/target stats is evaluated, mitigated and
+    amplified here, so the search only adds table entries.  BotRK is the
+    exception — it scales with the target's current HP, so only its % and
+    mitigation ratio are stored and the search applies them per hit.
+    """
     aa: float = 0.0
     aa_pta: float = 0.0
     aa_conq: float = 0.0
@@ -155,6 +167,10 @@ class DamageTable:
     hydra_active_cd: float = 10.0
     stridebreaker_damage: float = 0.0
     stridebreaker_cd: float = 15.0
+    # (attack interval, windup) keyed by extra bonus AS% (E / HoB).  Filled
+    # lazily by _apply_action — the champion's AS is fixed for one search,
+    # and extra AS only takes a handful of values.
+    aa_timing: Dict[float, Tuple[float, float]] = field(default_factory=dict)
 
 
 def build_damage_table(
@@ -190,7 +206,7 @@ def build_damage_table(
 
     # Helper to mitigate an item proc
     def _mitigate(proc_dict):
-        return calculate_damage(proc_dict, target, champion=champion)["total_damage"]
+        return calculate_damage(proc_dict, target, champion=champion).total_damage
 
     # ─── Item proc detection ───
     if items:
@@ -209,13 +225,13 @@ def build_damage_table(
             if isinstance(item, BladeOfTheRuinedKing):
                 pct = item.melee_pct if getattr(champion, 'is_melee', True) else item.ranged_pct
                 table.botrk_pct = pct
-                # Compute mitigation ratio: post_mitigation / raw for physical
-                test_raw = 100.0
-                test_result = calculate_damage(
-                    {"raw_damage": test_raw, "damage_type": "physical"},
-                    target, champion=champion,
+                # Armor multiplier, hoisted out of the search: each on-hit
+                # is then current_hp * pct * ratio, no calculate_damage call
+                _, ratio = _mitigation(
+                    target.armor, 0.0, 0.0,
+                    getattr(champion, 'armor_pen_pct', 0.0),
+                    getattr(champion, 'lethality', 0.0),
                 )
-                ratio = test_result["total_damage"] / test_raw if test_raw > 0 else 0
                 table.botrk_phys_ratio = round(ratio * static_mult, 6)
             # Other on-hit items (flat damage, pre-mitigated)
             elif isinstance(item, RecurveBow):
@@ -273,26 +289,26 @@ def build_damage_table(
                 table.hydra_active_cd = item.cooldown
 
     # Base damages (with static amp baked in)
-    aa_data = champion.auto_attack()
-    table.aa = _amp(calculate_damage(aa_data, target, champion=champion)["total_damage"])
+    aa_data = champion.auto_attack(rounded=False)
+    table.aa = _amp(calculate_damage(aa_data, target, champion=champion).total_damage)
 
-    q_data = champion.Q()
+    q_data = champion.Q(rounded=False)
     if "error" not in q_data:
-        table.q = _amp(calculate_damage(q_data, target, champion=champion)["total_damage"])
+        table.q = _amp(calculate_damage(q_data, target, champion=champion).total_damage)
         table.q_cd = q_data["cooldown"]
 
-    w_data = champion.W()
+    w_data = champion.W(rounded=False)
     if "error" not in w_data:
-        table.w = _amp(calculate_damage(w_data, target, champion=champion)["total_damage"])
+        table.w = _amp(calculate_damage(w_data, target, champion=champion).total_damage)
         table.w_cd = w_data["cooldown"]
 
-    e_data = champion.E()
+    e_data = champion.E(rounded=False)
     if "error" not in e_data:
-        table.e_crit = _amp(calculate_damage(e_data, target, champion=champion)["total_damage"])
+        table.e_crit = _amp(calculate_damage(e_data, target, champion=champion).total_damage)
         table.e_cd = e_data["cooldown"]
 
-    passive_data = champion.passive(target_max_hp=target.max_hp)
-    table.passive = _amp(calculate_damage(passive_data, target, champion=champion)["total_damage"])
+    passive_data = champion.passive(target_max_hp=target.max_hp, rounded=False)
+    table.passive = _amp(calculate_damage(passive_data, target, champion=champion).total_damage)
     table.passive_heal = passive_data.get("heal", 0.0)
 
     # R cooldown
@@ -302,16 +318,16 @@ def build_damage_table(
 
     # PtA variants (8% amp on ALL damage types including true damage from vitals)
     if rune and isinstance(rune, PressTheAttack):
-        table.aa_pta = _amp(calculate_damage(aa_data, target, champion=champion, damage_amp=0.08)["total_damage"])
+        table.aa_pta = _amp(calculate_damage(aa_data, target, champion=champion, damage_amp=0.08).total_damage)
         if "error" not in q_data:
-            table.q_pta = _amp(calculate_damage(q_data, target, champion=champion, damage_amp=0.08)["total_damage"])
+            table.q_pta = _amp(calculate_damage(q_data, target, champion=champion, damage_amp=0.08).total_damage)
         if "error" not in w_data:
-            table.w_pta = _amp(calculate_damage(w_data, target, champion=champion, damage_amp=0.08)["total_damage"])
+            table.w_pta = _amp(calculate_damage(w_data, target, champion=champion, damage_amp=0.08).total_damage)
         if "error" not in e_data:
-            table.e_crit_pta = _amp(calculate_damage(e_data, target, champion=champion, damage_amp=0.08)["total_damage"])
-        table.passive_pta = _amp(calculate_damage(passive_data, target, champion=champion, damage_amp=0.08)["total_damage"])
+            table.e_crit_pta = _amp(calculate_damage(e_data, target, champion=champion, damage_amp=0.08).total_damage)
+        table.passive_pta = _amp(calculate_damage(passive_data, target, champion=champion, damage_amp=0.08).total_damage)
         proc = rune.proc_damage(champion.level, champion.bonus_AD, champion.bonus_AP)
-        table.pta_proc = _amp(calculate_damage(proc, target, champion=champion)["total_damage"])
+        table.pta_proc = _amp(calculate_damage(proc, target, champion=champion).total_damage)
 
     # Conqueror variants (bonus AD at max stacks affects ability damage AND passive scaling)
     if rune and isinstance(rune, Conqueror):
@@ -319,19 +335,19 @@ def build_damage_table(
         conq_ad = bonus["bonus_AD"]
         champion.add_stats(bonus_AD=conq_ad)
         try:
-            table.aa_conq = _amp(calculate_damage(champion.auto_attack(), target, champion=champion)["total_damage"])
-            cq = champion.Q()
+            table.aa_conq = _amp(calculate_damage(champion.auto_attack(rounded=False), target, champion=champion).total_damage)
+            cq = champion.Q(rounded=False)
             if "error" not in cq:
-                table.q_conq = _amp(calculate_damage(cq, target, champion=champion)["total_damage"])
-            cw = champion.W()
+                table.q_conq = _amp(calculate_damage(cq, target, champion=champion).total_damage)
+            cw = champion.W(rounded=False)
             if "error" not in cw:
-                table.w_conq = _amp(calculate_damage(cw, target, champion=champion)["total_damage"])
-            ce = champion.E()
+                table.w_conq = _amp(calculate_damage(cw, target, champion=champion).total_damage)
+            ce = champion.E(rounded=False)
             if "error" not in ce:
-                table.e_crit_conq = _amp(calculate_damage(ce, target, champion=champion)["total_damage"])
+                table.e_crit_conq = _amp(calculate_damage(ce, target, champion=champion).total_damage)
             # Passive scales with bonus AD: 3% + 4% per 100 bonus AD
-            conq_passive = champion.passive(target_max_hp=target.max_hp)
-            table.passive_conq = _amp(calculate_damage(conq_passive, target, champion=champion)["total_damage"])
+            conq_passive = champion.passive(target_max_hp=target.max_hp, rounded=False)
+            table.passive_conq = _amp(calculate_damage(conq_passive, target, champion=champion).total_damage)
             table.passive_heal_conq = conq_passive.get("heal", 0.0)
         finally:
             champion.add_stats(bonus_AD=-conq_ad)
@@ -339,7 +355,7 @@ def build_damage_table(
     # Grasp proc
     if rune and isinstance(rune, GraspOfTheUndying):
         proc = rune.proc_damage(champion.total_HP, is_melee=champion.is_melee)
-        table.grasp_proc = _amp(calculate_damage(proc, target, champion=champion)["total_damage"])
+        table.grasp_proc = _amp(calculate_damage(proc, target, champion=champion).total_damage)
         heal = rune.healing(champion.total_HP, is_melee=champion.is_melee)
         table.grasp_heal = heal["heal"]
 
@@ -501,8 +517,13 @@ def _apply_action(
     t = s.time
 
     extra_as = _get_extra_as(s, champion, rune)
-    atk_interval = champion.attack_interval(extra_bonus_as_pct=extra_as)
-    wnd_time = champion.windup_time(extra_bonus_as_pct=extra_as)
+    timing = table.aa_timing.get(extra_as)
+    if timing is None:
+        timing = table.aa_timing[extra_as] = (
+            champion.attack_interval(extra_bonus_as_pct=extra_as),
+            champion.windup_time(extra_bonus_as_pct=extra_as),
+        )
+    atk_interval, wnd_time = timing
 
     # ─── WAIT ───
     if action == "WAIT":
@@ -565,7 +586,7 @@ def _apply_action(
         if s.has_botrk:
             s.target_current_hp = max(s.target_current_hp - damage, 0.0)
         s.actions.append((t, "HYDRA_ACTIVE", round(damage, 2),
-                          [f"AA-reset", f"dmg({round(damage, 0):.0f})"], action_heal))
+                          [f"AA-reset", f"dmg({damage:.0f})"], action_heal))
         return s
 
     # ─── STRIDEBREAKER (instant, damages) ───
@@ -586,7 +607,7 @@ def _apply_action(
         if s.has_botrk:
             s.target_current_hp = max(s.target_current_hp - damage, 0.0)
         s.actions.append((t, "STRIDEBREAKER", round(damage, 2),
-                          [f"dmg({round(damage, 0):.0f})"], action_heal))
+                          [f"dmg({damage:.0f})"], action_heal))
         return s
 
     # ─── DAMAGING ACTIONS ───
@@ -594,7 +615,8 @@ def _apply_action(
     damage = 0.0
     hit_time = t  # when damage actually lands (after windup/cast)
     notes = []
-    is_on_hit = action in ON_HIT_ACTIONS
+    aid = ACTION_IDS[action]
+    is_on_hit = (ON_HIT_MASK >> aid) & 1 == 1
 
     # Shojin: stack is granted AFTER damage (triggering ability does NOT
     # benefit from its own stack).  We record pre-damage stacks, then
@@ -652,7 +674,7 @@ def _apply_action(
     if s.has_botrk and is_on_hit and table.botrk_pct > 0:
         botrk_dmg = s.target_current_hp * table.botrk_pct * table.botrk_phys_ratio * pta_amp
         damage += botrk_dmg
-        notes.append(f"BotRK({round(botrk_dmg, 0):.0f})")
+        notes.append(f"BotRK({botrk_dmg:.0f})")
 
     # On-hit bonus (Wit's End, Nashor's, Recurve, Terminus, Titanic passive)
     if is_on_hit and (table.on_hit_physical > 0 or table.on_hit_magic > 0):
@@ -660,14 +682,14 @@ def _apply_action(
         on_hit_m = round(table.on_hit_magic * pta_amp, 2)
         damage += on_hit_p + on_hit_m
         if on_hit_p > 0:
-            notes.append(f"on-hit-P({round(on_hit_p, 0):.0f})")
+            notes.append(f"on-hit-P({on_hit_p:.0f})")
         if on_hit_m > 0:
-            notes.append(f"on-hit-M({round(on_hit_m, 0):.0f})")
+            notes.append(f"on-hit-M({on_hit_m:.0f})")
 
     # Spellblade (Trinity Force / Iceborn / Lich Bane)
     if s.has_spellblade:
         # Arm on ability cast (Q also arms since it's an ability cast)
-        if action in ABILITY_CAST_ACTIONS and s.spellblade_cd_until <= t:
+        if (ABILITY_CAST_MASK >> aid) & 1 and s.spellblade_cd_until <= t:
             s.spellblade_armed = True
         # Proc on on-hit action (Q both arms AND procs in same action)
         if is_on_hit and s.spellblade_armed:
@@ -675,7 +697,7 @@ def _apply_action(
             damage += sb_dmg
             s.spellblade_armed = False
             s.spellblade_cd_until = hit_time + table.spellblade_cd
-            notes.append(f"Spellblade({round(sb_dmg, 0):.0f})")
+            notes.append(f"Spellblade({sb_dmg:.0f})")
 
     # Energized (Voltaic / RFC / Shiv / Stormrazor)
     if s.has_energized and is_on_hit:
@@ -683,7 +705,7 @@ def _apply_action(
             en_dmg = round(table.energized_damage * pta_amp, 2)
             damage += en_dmg
             s.energized_stacks = 0
-            notes.append(f"Energized({round(en_dmg, 0):.0f})")
+            notes.append(f"Energized({en_dmg:.0f})")
         s.energized_stacks = min(s.energized_stacks + s.energized_per_aa,
                                  s.energized_max)
 
@@ -694,27 +716,27 @@ def _apply_action(
             kr_dmg = round(table.kraken_proc * pta_amp, 2)
             damage += kr_dmg
             s.kraken_hits = 0
-            notes.append(f"Kraken({round(kr_dmg, 0):.0f})")
+            notes.append(f"Kraken({kr_dmg:.0f})")
 
     # Sundered Sky (first on-hit per 10s CD)
     if s.has_sundered_sky and is_on_hit and s.sundered_sky_cd_until <= t:
         ss_dmg = round(table.sundered_sky_bonus * pta_amp, 2)
         damage += ss_dmg
         s.sundered_sky_cd_until = hit_time + table.sundered_sky_cd
-        notes.append(f"SunderedSky({round(ss_dmg, 0):.0f})")
+        notes.append(f"SunderedSky({ss_dmg:.0f})")
 
     # Dead Man's Plate (first hit only, full momentum)
     if s.has_dead_mans and is_on_hit and s.dead_mans_available:
         dm_dmg = round(table.dead_mans_bonus * pta_amp, 2)
         damage += dm_dmg
         s.dead_mans_available = False
-        notes.append(f"DeadMans({round(dm_dmg, 0):.0f})")
+        notes.append(f"DeadMans({dm_dmg:.0f})")
 
     # Liandry's burn (on ability damage actions, not basic AA)
-    if table.liandry_burn > 0 and action in ABILITY_DAMAGE_ACTIONS:
+    if table.liandry_burn > 0 and (ABILITY_DAMAGE_MASK >> aid) & 1:
         lb_dmg = round(table.liandry_burn * pta_amp, 2)
         damage += lb_dmg
-        notes.append(f"Burn({round(lb_dmg, 0):.0f})")
+        notes.append(f"Burn({lb_dmg:.0f})")
 
     # ─── VITAL PROC (uses hit_time for when damage actually lands) ───
     vital_damage = 0.0
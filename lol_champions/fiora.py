@@ -1,10 +1,54 @@
 """Fiora champion implementation."""
 
-from typing import Dict, Union
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Union
 from .champion import Champion
 from .ability import Ability
 
 
+# Shared, read-only result for an ability at rank 0 — returned by Q/W/E/R
+# instead of building a fresh error dict on every call.
+NOT_LEARNED = MappingProxyType({"error": "Ability not learned yet"})
+
+
+@dataclass(slots=True, frozen=True)
+class BoundFiora:
+    """Fiora's rank-dependent ability constants, resolved once by ``Fiora.bind()``.
+
+    Only the champion's stats are left as arguments, so each raw damage is
+    a single multiply-add.  Matches ``Fiora.Q/W/E(rounded=False)`` and
+    ``passive(rounded=False)`` for the ranks at bind time.  Unlearned
+    abilities have an infinite cooldown and zero damage, like
+    ``Fiora.get_cooldown()``.
+    """
+    q_cooldown: float
+    q_base: float
+    q_coef: float       # bonus AD ratio
+    w_cooldown: float
+    w_base: float
+    e_cooldown: float
+    e_coef: float       # crit multiplier on total AD (1.6 = 160%)
+    e_bonus_as: float
+
+    def q_raw(self, bonus_ad: float) -> float:
+        """Raw Q damage for *bonus_ad*."""
+        return self.q_base + bonus_ad * self.q_coef
+
+    def w_raw(self, total_ap: float) -> float:
+        """Raw W damage for *total_ap* (100% AP ratio)."""
+        return self.w_base + total_ap
+
+    def e_raw(self, total_ad: float) -> float:
+        """Raw empowered E attack damage for *total_ad*."""
+        return total_ad * self.e_coef
+
+    @staticmethod
+    def passive_raw(target_max_hp: float, bonus_ad: float) -> float:
+        """Raw vital true damage: 3% (+4% per 100 bonus AD) of max HP."""
+        return target_max_hp * (3.0 + bonus_ad / 100 * 4.0) / 100
+
+
 class Fiora(Champion):
     """Fiora - The Grand Duelist.
 
@@ -27,9 +71,30 @@ class Fiora(Champion):
     # R reveals 4 vitals 0.5s after cast (immediately targetable once they appear)
     R_VITAL_APPEAR_DELAY = 0.5
 
-    # E bonus attack speed by rank (index 0 = rank 1)
+    # Ability tables by rank (index 0 = rank 1)
+    # Q: cooldown, base damage and bonus AD ratio
+    Q_COOLDOWNS = (13, 11.25, 9.5, 7.75, 6)
+    Q_BASE_DAMAGES = (70, 80, 90, 100, 110)
+    Q_AD_RATIOS = (0.90, 0.95, 1.00, 1.05, 1.10)
+    # W: cooldown and base magic damage
+    W_COOLDOWNS = (24, 22, 20, 18, 16)
+    W_BASE_DAMAGES = (110, 150, 190, 230, 270)
+    # E: cooldown, bonus attack speed % and crit damage %
     # Bonus AS only applies for the 2 empowered attacks, not a flat duration
-    E_BONUS_AS = [50, 60, 70, 80, 90]
+    E_COOLDOWNS = (11, 10, 9, 8, 7)
+    E_BONUS_AS = (50, 60, 70, 80, 90)
+    E_CRIT_DAMAGES = (160, 170, 180, 190, 200)
+    # R: cooldown and heal per vital tick
+    R_COOLDOWNS = (110, 90, 70)
+    R_HEAL_PER_TICK = (18.75, 25, 31.25)
+
+    # Cooldown table per ability key, for get_cooldown()
+    _COOLDOWNS = {
+        'Q': Q_COOLDOWNS,
+        'W': W_COOLDOWNS,
+        'E': E_COOLDOWNS,
+        'R': R_COOLDOWNS,
+    }
 
     def __init__(self):
         """Initialize Fiora with her base stats."""
@@ -54,6 +119,13 @@ class Fiora(Champion):
         self.W_ability = Ability("Riposte", max_level=5)
         self.E_ability = Ability("Bladework", max_level=5)
         self.R_ability = Ability("Grand Challenge", max_level=3)
+        # Ability key -> Ability, for level_ability()
+        self._abilities = {
+            'Q': self.Q_ability,
+            'W': self.W_ability,
+            'E': self.E_ability,
+            'R': self.R_ability,
+        }
     
     def level_ability(self, ability: str) -> bool:
         """Level up a specific ability.
@@ -86,35 +158,29 @@ class Fiora(Champion):
                 print("Ultimate rank 3 unlocks at level 16!")
                 return False
         
-        # Try to level the ability
-        success = False
-        if ability == 'Q':
-            success = self.Q_ability.level_up()
-        elif ability == 'W':
-            success = self.W_ability.level_up()
-        elif ability == 'E':
-            success = self.E_ability.level_up()
-        elif ability == 'R':
-            success = self.R_ability.level_up()
-        
-        # Consume skill point if successful
+        ability_obj = self._abilities.get(ability)
+        if ability_obj is None:
+            return False
+
+        # Try to level the ability, consuming a skill point if successful
+        success = ability_obj.level_up()
         if success:
             self.skill_points -= 1
-            ability_obj = getattr(self, f"{ability}_ability")
             print(f"Leveled up {ability_obj.name} to rank {ability_obj.current_level}! "
                   f"Skill points remaining: {self.skill_points}")
         else:
-            if ability in ['Q', 'W', 'E', 'R']:
-                ability_obj = getattr(self, f"{ability}_ability")
-                print(f"{ability_obj.name} is already at max level!")
+            print(f"{ability_obj.name} is already at max level!")
         
         return success
     
-    def passive(self, target_max_hp: float) -> Dict[str, Union[float, str]]:
+    def passive(self, target_max_hp: float,
+                rounded: bool = True) -> Dict[str, Union[float, str]]:
         """Duelist's Dance - Hitting a vital deals true damage, heals, and grants movement speed.
         
         Args:
             target_max_hp: The maximum HP of the target whose vital is being hit
+            rounded: Round values to 2 decimals for display; the DPS engine
+                     passes False to keep full precision
             
         Returns:
             Dictionary containing:
@@ -144,92 +210,125 @@ class Fiora(Champion):
         else:
             ms_bonus = ms_bonuses[self.R_ability.current_level - 1]
         
+        if rounded:
+            true_damage = round(true_damage, 2)
+            true_damage_percent = round(true_damage_percent, 2)
+            heal = round(heal, 2)
+
         return {
-            "raw_damage": round(true_damage, 2),
+            "raw_damage": true_damage,
             "damage_type": "true",
-            "true_damage": round(true_damage, 2),
-            "true_damage_percent": round(true_damage_percent, 2),
-            "heal": round(heal, 2),
+            "true_damage": true_damage,
+            "true_damage_percent": true_damage_percent,
+            "heal": heal,
             "movement_speed_bonus": f"{ms_bonus}%",
             "duration": 1.85
         }
 
-    def Q(self) -> Dict[str, Union[float, str]]:
+    def Q(self, rounded: bool = True) -> Dict[str, Union[float, str]]:
         """Lunge - Dash forward and strike an enemy.
         
         Cost: 20 Mana
+
+        Args:
+            rounded: Round damage to 2 decimals (False keeps full precision)
         
         Returns:
-            Dictionary with cooldown and total damage, or error if not learned
+            Dictionary with cooldown and total damage, or NOT_LEARNED if not learned
         """
         if self.Q_ability.current_level == 0:
-            return {"error": "Ability not learned yet"}
-        
-        cooldowns = [13, 11.25, 9.5, 7.75, 6]
-        base_damages = [70, 80, 90, 100, 110]
-        ad_ratios = [0.90, 0.95, 1.00, 1.05, 1.10]
+            return NOT_LEARNED
         
         level = self.Q_ability.current_level - 1
-        damage = base_damages[level] + (self.bonus_AD * ad_ratios[level])
+        base_damage = self.Q_BASE_DAMAGES[level]
+        ad_ratio = self.Q_AD_RATIOS[level]
+        damage = base_damage + (self.bonus_AD * ad_ratio)
+        if rounded:
+            damage = round(damage, 2)
         
         return {
-            "cooldown": cooldowns[level],
-            "base_damage": base_damages[level],
-            "total_damage": round(damage, 2),
-            "raw_damage": round(damage, 2),
+            "cooldown": self.Q_COOLDOWNS[level],
+            "base_damage": base_damage,
+            "total_damage": damage,
+            "raw_damage": damage,
             "damage_type": "physical",
-            "ad_ratio": f"{int(ad_ratios[level] * 100)}% bonus AD"
+            "ad_ratio": f"{int(ad_ratio * 100)}% bonus AD"
         }
     
-    def W(self) -> Dict[str, Union[float, str]]:
+    @classmethod
+    def Q_damage_curve(cls, bonus_ad_values: Iterable[float], q_rank: int) -> List[float]:
+        """Raw Q damage over a sweep of bonus AD values.
+
+        Intended for balance tooling that plots Q damage against bonus AD.
+        The rank's base damage and ratio are looked up once, so each point
+        costs a single multiply-add.
+
+        Args:
+            bonus_ad_values: Bonus AD values to evaluate
+            q_rank: Q rank (1-5)
+
+        Returns:
+            Unrounded pre-mitigation Q damage for each bonus AD value, in
+            input order (round for display)
+
+        Raises:
+            ValueError: If q_rank is outside 1-5
+        """
+        if not 1 <= q_rank <= len(cls.Q_BASE_DAMAGES):
+            raise ValueError(f"q_rank must be 1-{len(cls.Q_BASE_DAMAGES)}, got {q_rank}")
+        base = cls.Q_BASE_DAMAGES[q_rank - 1]
+        ratio = cls.Q_AD_RATIOS[q_rank - 1]
+        return [base + bonus_ad * ratio for bonus_ad in bonus_ad_values]
+    
+    def W(self, rounded: bool = True) -> Dict[str, Union[float, str]]:
         """Riposte - Parry all damage and counterattack.
         
         Cost: 50 Mana
+
+        Args:
+            rounded: Round damage to 2 decimals (False keeps full precision)
         
         Returns:
-            Dictionary with cooldown and magic damage, or error if not learned
+            Dictionary with cooldown and magic damage, or NOT_LEARNED if not learned
         """
         if self.W_ability.current_level == 0:
-            return {"error": "Ability not learned yet"}
-        
-        cooldowns = [24, 22, 20, 18, 16]
-        base_damages = [110, 150, 190, 230, 270]
+            return NOT_LEARNED
         
         level = self.W_ability.current_level - 1
-        damage = base_damages[level] + self.total_AP  # 100% AP ratio
+        base_damage = self.W_BASE_DAMAGES[level]
+        damage = base_damage + self.total_AP  # 100% AP ratio
 
         return {
-            "cooldown": cooldowns[level],
-            "magic_damage": base_damages[level],
-            "raw_damage": round(damage, 2),
+            "cooldown": self.W_COOLDOWNS[level],
+            "magic_damage": base_damage,
+            "raw_damage": round(damage, 2) if rounded else damage,
             "damage_type": "magic",
             "ap_ratio": "100% AP"
         }
     
-    def E(self) -> Dict[str, Union[float, str]]:
+    def E(self, rounded: bool = True) -> Dict[str, Union[float, str]]:
         """Bladework - Empowered attacks with bonus attack speed.
         
         Cost: 40 Mana
+
+        Args:
+            rounded: Round damage to 2 decimals (False keeps full precision)
         
         Returns:
-            Dictionary with cooldown, attack speed, and crit damage, or error if not learned
+            Dictionary with cooldown, attack speed, and crit damage, or NOT_LEARNED if not learned
         """
         if self.E_ability.current_level == 0:
-            return {"error": "Ability not learned yet"}
-        
-        cooldowns = [11, 10, 9, 8, 7]
-        bonus_attack_speeds = [50, 60, 70, 80, 90]
-        crit_damages = [160, 170, 180, 190, 200]
+            return NOT_LEARNED
         
         level = self.E_ability.current_level - 1
-        crit_multiplier = crit_damages[level] / 100.0
-        empowered_damage = self.total_AD * crit_multiplier
+        crit_damage = self.E_CRIT_DAMAGES[level]
+        empowered_damage = self.total_AD * (crit_damage / 100.0)
 
         return {
-            "cooldown": cooldowns[level],
-            "bonus_attack_speed": f"{bonus_attack_speeds[level]}%",
-            "critical_damage": f"{crit_damages[level]}%",
-            "raw_damage": round(empowered_damage, 2),
+            "cooldown": self.E_COOLDOWNS[level],
+            "bonus_attack_speed": f"{self.E_BONUS_AS[level]}%",
+            "critical_damage": f"{crit_damage}%",
+            "raw_damage": round(empowered_damage, 2) if rounded else empowered_damage,
             "damage_type": "physical",
         }
     
@@ -239,23 +338,41 @@ class Fiora(Champion):
         Cost: 100 Mana
         
         Returns:
-            Dictionary with cooldown and healing info, or error if not learned
+            Dictionary with cooldown and healing info, or NOT_LEARNED if not learned
         """
         if self.R_ability.current_level == 0:
-            return {"error": "Ability not learned yet"}
-        
-        cooldowns = [110, 90, 70]
-        heal_per_tick = [18.75, 25, 31.25]
+            return NOT_LEARNED
         
         level = self.R_ability.current_level - 1
         
         return {
-            "cooldown": cooldowns[level],
-            "heal_per_tick": heal_per_tick[level],
+            "cooldown": self.R_COOLDOWNS[level],
+            "heal_per_tick": self.R_HEAL_PER_TICK[level],
             "heal_bonus_ad_ratio": "15% bonus AD",
             "duration": "5 seconds"
         }
     
+    def bind(self) -> BoundFiora:
+        """Resolve Q/W/E rank constants for the current ability ranks.
+
+        Item sweeps only move Fiora's bonus stats, so the bound constants stay
+        valid across a whole build search; re-bind after leveling an ability.
+        """
+        inf = float('inf')
+        q = self.Q_ability.current_level - 1
+        w = self.W_ability.current_level - 1
+        e = self.E_ability.current_level - 1
+        return BoundFiora(
+            q_cooldown=self.Q_COOLDOWNS[q] if q >= 0 else inf,
+            q_base=self.Q_BASE_DAMAGES[q] if q >= 0 else 0.0,
+            q_coef=self.Q_AD_RATIOS[q] if q >= 0 else 0.0,
+            w_cooldown=self.W_COOLDOWNS[w] if w >= 0 else inf,
+            w_base=self.W_BASE_DAMAGES[w] if w >= 0 else 0.0,
+            e_cooldown=self.E_COOLDOWNS[e] if e >= 0 else inf,
+            e_coef=self.E_CRIT_DAMAGES[e] / 100.0 if e >= 0 else 0.0,
+            e_bonus_as=self.E_BONUS_AS[e] if e >= 0 else 0.0,
+        )
+
     def e_bonus_attack_speed(self) -> float:
         """Return E's bonus attack speed % at current rank, or 0 if not learned."""
         if self.E_ability.current_level == 0:
@@ -267,16 +384,10 @@ class Fiora(Champion):
 
         Returns float('inf') if ability is not learned.
         """
-        cooldowns = {
-            'Q': [13, 11.25, 9.5, 7.75, 6],
-            'W': [24, 22, 20, 18, 16],
-            'E': [11, 10, 9, 8, 7],
-            'R': [110, 90, 70],
-        }
         ab = getattr(self, f"{ability}_ability")
         if ab.current_level == 0:
             return float('inf')
-        return cooldowns[ability][ab.current_level - 1]
+        return self._COOLDOWNS[ability][ab.current_level - 1]
 
     def __str__(self) -> str:
         """String representation including abilities."""
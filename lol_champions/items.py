@@ -2,27 +2,58 @@
 
 Models item passives/actives that deal damage or amplify damage.
 Proc items expose a ``proc_damage(champion, target)`` method returning
-a dict with ``raw_damage`` and ``damage_type`` keys — the same contract
-used by abilities and runes, so the result feeds directly into
+a ``ProcResult(raw_damage, damage_type)`` named tuple, evaluated from the
+item's ``proc_coefficients(is_melee)``.  The result also answers
+``["raw_damage"]``/``["damage_type"]`` like the dicts returned by
+abilities and runes, so the result feeds directly into
 ``calculate_damage()``.
 
 Stat-only items (no proc) use ``DataDragon.item_stats()`` +
 ``champion.add_stats()`` — no dataclass needed.
 
+Item dataclasses are slotted and frozen (immutable config), so
+``get_item(name)`` hands out one shared instance per item.  Spear of Shojin
+is the exception: it carries mutable stacks and is never shared.
+
 All values sourced from https://leagueoflegends.fandom.com/wiki/
 """
 
-from dataclasses import dataclass
-from typing import Dict, Any
+import functools
+from dataclasses import dataclass, field, fields, is_dataclass
+from typing import ClassVar, Dict, Any, List, NamedTuple, Sequence, Protocol
+
+from .damage import ProcResult, PHYSICAL, MAGIC
+
+
+class ProcChampion(Protocol):
+    """Champion attributes read by item procs (all set by ``Champion``)."""
+    base_AD: float
+    total_AD: float
+    total_AP: float
+    total_HP: float
+    bonus_HP: float
+    is_melee: bool
+    level: int
 
 
 def _level_scale(min_val: float, max_val: float, level: int,
                  max_level: int = 18) -> float:
     """Linear interpolation for level-based item scaling (1-18)."""
-    lvl = min(max(level, 1), max_level)
+    lvl = 1 if level < 1 else (max_level if level > max_level else level)
     return min_val + (max_val - min_val) * (lvl - 1) / (max_level - 1)
 
 
+def _level_scale_vec(min_vals: Sequence[float], max_vals: Sequence[float],
+                     level: int, max_level: int = 18) -> List[float]:
+    """``_level_scale`` over parallel min/max sequences at a single level.
+
+    The clamped level fraction is computed once and shared by every pair.
+    """
+    lvl = 1 if level < 1 else (max_level if level > max_level else level)
+    frac = (lvl - 1) / (max_level - 1)
+    return [lo + (hi - lo) * frac for lo, hi in zip(min_vals, max_vals)]
+
+
 # ─── Action sets ───
 
 # Actions that apply on-hit effects (life steal, BotRK, Wit's End, etc.)
@@ -38,13 +69,55 @@ ABILITY_DAMAGE_ACTIONS = {"Q", "W", "E_FIRST", "E_CRIT"}
 SHOJIN_AMPLIFIED_ACTIONS = {"Q", "W", "E", "E_FIRST", "E_CRIT", "PASSIVE"}
 SHOJIN_STACK_GRANTING_ACTIONS = {"Q", "W", "E", "E_FIRST", "E_CRIT"}
 
+# ─── Action bitmasks ───
+# Every combo step / DPS action gets a small integer id, and each action
+# set above doubles as an int bitmask, so membership in a hot loop is
+# ``(MASK >> id) & 1`` on an id resolved once per action.
+ACTION_IDS = {
+    name: i for i, name in enumerate((
+        "AA", "Q", "W", "E", "E_FIRST", "E_CRIT", "E_ACTIVATE", "R_ACTIVATE",
+        "PASSIVE", "WAIT", "HYDRA_ACTIVE", "STRIDEBREAKER",
+    ))
+}
+
+
+def _action_mask(actions) -> int:
+    return sum(1 << ACTION_IDS[a] for a in actions)
+
+
+ON_HIT_MASK = _action_mask(ON_HIT_ACTIONS)
+ABILITY_CAST_MASK = _action_mask(ABILITY_CAST_ACTIONS)
+ABILITY_DAMAGE_MASK = _action_mask(ABILITY_DAMAGE_ACTIONS)
+SHOJIN_AMPLIFIED_MASK = _action_mask(SHOJIN_AMPLIFIED_ACTIONS)
+SHOJIN_STACK_GRANTING_MASK = _action_mask(SHOJIN_STACK_GRANTING_ACTIONS)
+
+
+@functools.lru_cache(maxsize=64)
+def _folded_action_id(action: str) -> int:
+    return ACTION_IDS.get(action.upper(), -1)
+
+
+def action_id(action: str) -> int:
+    """Integer id for an action name (case-insensitive), or -1 if unknown.
+
+    Canonical upper-case names are a single dict lookup; other spellings
+    fall back to a cached case-folding lookup.
+    """
+    aid = ACTION_IDS.get(action)
+    return _folded_action_id(action) if aid is None else aid
+
+
+def in_action_mask(mask: int, aid: int) -> bool:
+    """True if the action with id *aid* belongs to *mask*."""
+    return aid >= 0 and (mask >> aid) & 1 == 1
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # STACKING AMPLIFIER
 # ═══════════════════════════════════════════════════════════════════════
 
 
-@dataclass
+@dataclass(slots=True)
 class SpearOfShojin:
     """Spear of Shojin — Focused Will passive.
 
@@ -65,27 +138,111 @@ class SpearOfShojin:
     stacks: int = 0
     max_stacks: int = 4
     amp_per_stack: float = 0.03
+    # Amp per stack count (index = stacks), built once from the fields above
+    _amp_table: tuple = field(init=False, repr=False, compare=False)
+    # Amp at the current stack count; kept in sync by add_stack() / reset(),
+    # so change stacks through those rather than assigning directly.
+    _cached_amp: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._amp_table = tuple(n * self.amp_per_stack for n in range(self.max_stacks + 1))
+        self.stacks = max(0, min(self.stacks, self.max_stacks))
+        self._cached_amp = self._amp_table[self.stacks]
 
     def damage_amp(self) -> float:
-        return min(self.stacks, self.max_stacks) * self.amp_per_stack
+        return self._cached_amp
 
     def add_stack(self) -> int:
-        self.stacks = min(self.stacks + 1, self.max_stacks)
+        self.stacks = max(0, min(self.stacks + 1, self.max_stacks))
+        self._cached_amp = self._amp_table[self.stacks]
         return self.stacks
 
     def reset(self) -> None:
         self.stacks = 0
+        self._cached_amp = 0.0
 
     @staticmethod
-    def is_amplified(action: str) -> bool:
-        return action.upper() in SHOJIN_AMPLIFIED_ACTIONS
+    def is_amplified(action) -> bool:
+        """*action* is an action name or an id from ``action_id()``."""
+        aid = action if isinstance(action, int) else action_id(action)
+        return in_action_mask(SHOJIN_AMPLIFIED_MASK, aid)
 
     @staticmethod
-    def grants_stack(action: str) -> bool:
-        return action.upper() in SHOJIN_STACK_GRANTING_ACTIONS
+    def grants_stack(action) -> bool:
+        """*action* is an action name or an id from ``action_id()``."""
+        aid = action if isinstance(action, int) else action_id(action)
+        return in_action_mask(SHOJIN_STACK_GRANTING_MASK, aid)
 
     def modifier_dict(self) -> Dict[str, Any]:
-        return {"name": self.name, "amp": self.damage_amp()}
+        return {"name": self.name, "amp": self._cached_amp}
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# LINEAR PROCS — shared proc_damage built from per-item coefficients
+# ═══════════════════════════════════════════════════════════════════════
+
+
+class ProcCoefficients(NamedTuple):
+    """One item proc as a linear combination of champion/target stats.
+
+    Raw damage is ``flat + ad_b * base_AD + ad_t * total_AD + ap * total_AP
+    + tgt_hp * target_current_hp + self_hp * total_HP`` plus the
+    ``lvl_lo``..``lvl_hi`` value at the champion's level.  ``proc_damage``
+    and the ``items_soa`` arrays are both built from these.
+    """
+    damage_type: str
+    flat: float = 0.0
+    ad_b: float = 0.0
+    ad_t: float = 0.0
+    ap: float = 0.0
+    tgt_hp: float = 0.0
+    self_hp: float = 0.0
+    lvl_lo: float = 0.0
+    lvl_hi: float = 0.0
+
+
+class LinearProc:
+    """Mixin for items whose proc is described by ``proc_coefficients()``.
+
+    Subclasses implement ``proc_coefficients(is_melee)``; this evaluates
+    it for one champion/target.  ``target_current_hp`` in *ctx* overrides
+    the target's max HP for % current HP procs.
+    """
+    __slots__ = ()
+
+    def proc_damage(self, champion: ProcChampion, target, **ctx) -> ProcResult:
+        c = self.proc_coefficients(champion.is_melee)
+        raw = (c.flat + c.ad_b * champion.base_AD + c.ad_t * champion.total_AD
+               + c.ap * champion.total_AP)
+        if c.tgt_hp:
+            raw += c.tgt_hp * ctx.get("target_current_hp", target.max_hp)
+        if c.self_hp:
+            raw += c.self_hp * champion.total_HP
+        if c.lvl_lo or c.lvl_hi:
+            raw += _level_scale(c.lvl_lo, c.lvl_hi, champion.level)
+        return ProcResult(raw, c.damage_type)
+
+
+@dataclass(slots=True, frozen=True)
+class FlatOnHit(LinearProc):
+    """Base for items whose proc deals a fixed amount of one damage type.
+
+    Subclasses (Wit's End, Recurve Bow, Terminus and the energized items)
+    keep their own dataclass field for the amount (``flat_magic``,
+    ``flat_damage``, ...), name it in ``_FLAT_FIELD`` and set the class
+    constant ``damage_type``; they all share this ``proc_coefficients``.
+    ``flat`` reads the amount under a common name.
+    """
+    name: str = ""
+    damage_type: ClassVar[str] = PHYSICAL
+    _FLAT_FIELD: ClassVar[str] = ""
+
+    @property
+    def flat(self) -> float:
+        return getattr(self, self._FLAT_FIELD)
+
+    def proc_coefficients(self, is_melee: bool = True) -> ProcCoefficients:
+        return ProcCoefficients(self.damage_type, flat=getattr(self, self._FLAT_FIELD))
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -93,8 +250,8 @@ class SpearOfShojin:
 # ═══════════════════════════════════════════════════════════════════════
 
 
-@dataclass
-class BladeOfTheRuinedKing:
+@dataclass(slots=True, frozen=True)
+class BladeOfTheRuinedKing(LinearProc):
     """Blade of the Ruined King — Mist's Edge.
 
     Stats: +40 AD, +25% AS.
@@ -105,14 +262,13 @@ class BladeOfTheRuinedKing:
     melee_pct: float = 0.09
     ranged_pct: float = 0.06
 
-    def proc_damage(self, champion, target, **ctx) -> dict:
-        pct = self.melee_pct if getattr(champion, 'is_melee', True) else self.ranged_pct
-        hp = ctx.get("target_current_hp", target.max_hp)
-        return {"raw_damage": hp * pct, "damage_type": "physical"}
+    def proc_coefficients(self, is_melee: bool = True) -> ProcCoefficients:
+        pct = self.melee_pct if is_melee else self.ranged_pct
+        return ProcCoefficients(PHYSICAL, tgt_hp=pct)
 
 
-@dataclass
-class WitsEnd:
+@dataclass(slots=True, frozen=True)
+class WitsEnd(FlatOnHit):
     """Wit's End — Fray.
 
     Stats: +40 AD, +40% AS, +40 MR.
@@ -120,13 +276,12 @@ class WitsEnd:
     """
     name: str = "Wit's End"
     flat_magic: float = 45.0
-
-    def proc_damage(self, champion, target, **ctx) -> dict:
-        return {"raw_damage": self.flat_magic, "damage_type": "magic"}
+    damage_type: ClassVar[str] = MAGIC
+    _FLAT_FIELD: ClassVar[str] = "flat_magic"
 
 
-@dataclass
-class NashorsTooth:
+@dataclass(slots=True, frozen=True)
+class NashorsTooth(LinearProc):
     """Nashor's Tooth — Icathian Bite.
 
     Stats: +100 AP, +50% AS.
@@ -136,14 +291,12 @@ class NashorsTooth:
     base_damage: float = 15.0
     ap_ratio: float = 0.15
 
-    def proc_damage(self, champion, target, **ctx) -> dict:
-        ap = getattr(champion, 'total_AP', 0)
-        return {"raw_damage": self.base_damage + ap * self.ap_ratio,
-                "damage_type": "magic"}
+    def proc_coefficients(self, is_melee: bool = True) -> ProcCoefficients:
+        return ProcCoefficients(MAGIC, flat=self.base_damage, ap=self.ap_ratio)
 
 
-@dataclass
-class RecurveBow:
+@dataclass(slots=True, frozen=True)
+class RecurveBow(FlatOnHit):
     """Recurve Bow — Sting.
 
     Stats: +15% AS.
@@ -151,13 +304,12 @@ class RecurveBow:
     """
     name: str = "Recurve Bow"
     flat_physical: float = 15.0
+    damage_type: ClassVar[str] = PHYSICAL
+    _FLAT_FIELD: ClassVar[str] = "flat_physical"
 
-    def proc_damage(self, champion, target, **ctx) -> dict:
-        return {"raw_damage": self.flat_physical, "damage_type": "physical"}
 
-
-@dataclass
-class Terminus:
+@dataclass(slots=True, frozen=True)
+class Terminus(FlatOnHit):
     """Terminus — Shadow / Juxtaposition.
 
     Stats: +30 AD, +30% AS.
@@ -169,13 +321,12 @@ class Terminus:
     """
     name: str = "Terminus"
     flat_magic: float = 30.0
-
-    def proc_damage(self, champion, target, **ctx) -> dict:
-        return {"raw_damage": self.flat_magic, "damage_type": "magic"}
+    damage_type: ClassVar[str] = MAGIC
+    _FLAT_FIELD: ClassVar[str] = "flat_magic"
 
 
-@dataclass
-class TitanicHydra:
+@dataclass(slots=True, frozen=True)
+class TitanicHydra(LinearProc):
     """Titanic Hydra — Colossus (passive on-hit) + Titanic Crescent (active).
 
     Stats: +50 AD, +500 HP.
@@ -191,17 +342,16 @@ class TitanicHydra:
     ranged_active_pct: float = 0.02
     active_cooldown: float = 10.0
 
-    def proc_damage(self, champion, target, **ctx) -> dict:
+    def proc_coefficients(self, is_melee: bool = True) -> ProcCoefficients:
         """Passive on-hit damage to primary target."""
-        pct = self.melee_passive_pct if getattr(champion, 'is_melee', True) else self.ranged_passive_pct
-        hp = getattr(champion, 'total_HP', 0)
-        return {"raw_damage": self.passive_flat + hp * pct, "damage_type": "physical"}
+        pct = self.melee_passive_pct if is_melee else self.ranged_passive_pct
+        return ProcCoefficients(PHYSICAL, flat=self.passive_flat, self_hp=pct)
 
-    def active_damage(self, champion, target, **ctx) -> dict:
+    def active_damage(self, champion: ProcChampion, target, **ctx) -> ProcResult:
         """Titanic Crescent active — enhanced AA to primary target."""
-        pct = self.melee_active_pct if getattr(champion, 'is_melee', True) else self.ranged_active_pct
-        hp = getattr(champion, 'total_HP', 0)
-        return {"raw_damage": hp * pct, "damage_type": "physical"}
+        pct = self.melee_active_pct if champion.is_melee else self.ranged_active_pct
+        hp = champion.total_HP
+        return ProcResult(hp * pct, PHYSICAL)
 
     @staticmethod
     def is_active() -> bool:
@@ -213,8 +363,8 @@ class TitanicHydra:
 # ═══════════════════════════════════════════════════════════════════════
 
 
-@dataclass
-class KrakenSlayer:
+@dataclass(slots=True, frozen=True)
+class KrakenSlayer(LinearProc):
     """Kraken Slayer — Bring It Down.
 
     Stats: +40 AD, +25% AS.
@@ -227,12 +377,10 @@ class KrakenSlayer:
     ranged_min: float = 120.0
     ranged_max: float = 168.0
 
-    def proc_damage(self, champion, target, **ctx) -> dict:
-        is_melee = getattr(champion, 'is_melee', True)
+    def proc_coefficients(self, is_melee: bool = True) -> ProcCoefficients:
         lo = self.melee_min if is_melee else self.ranged_min
         hi = self.melee_max if is_melee else self.ranged_max
-        base = _level_scale(lo, hi, champion.level)
-        return {"raw_damage": base, "damage_type": "physical"}
+        return ProcCoefficients(PHYSICAL, lvl_lo=lo, lvl_hi=hi)
 
     @staticmethod
     def hits_to_proc() -> int:
@@ -245,8 +393,8 @@ class KrakenSlayer:
 # ═══════════════════════════════════════════════════════════════════════
 
 
-@dataclass
-class TrinityForce:
+@dataclass(slots=True, frozen=True)
+class TrinityForce(LinearProc):
     """Trinity Force — Spellblade.
 
     Stats: +35 AD, +300 HP, +33% AS, 15 ability haste.
@@ -257,17 +405,16 @@ class TrinityForce:
     base_ad_ratio: float = 2.0
     cooldown: float = 1.5
 
-    def proc_damage(self, champion, target, **ctx) -> dict:
-        return {"raw_damage": champion.base_AD * self.base_ad_ratio,
-                "damage_type": "physical"}
+    def proc_coefficients(self, is_melee: bool = True) -> ProcCoefficients:
+        return ProcCoefficients(PHYSICAL, ad_b=self.base_ad_ratio)
 
     @staticmethod
     def is_spellblade() -> bool:
         return True
 
 
-@dataclass
-class IcebornGauntlet:
+@dataclass(slots=True, frozen=True)
+class IcebornGauntlet(LinearProc):
     """Iceborn Gauntlet — Spellblade.
 
     Stats: +300 HP, +50 AR, 15 ability haste.
@@ -279,17 +426,16 @@ class IcebornGauntlet:
     base_ad_ratio: float = 1.5
     cooldown: float = 1.5
 
-    def proc_damage(self, champion, target, **ctx) -> dict:
-        return {"raw_damage": champion.base_AD * self.base_ad_ratio,
-                "damage_type": "physical"}
+    def proc_coefficients(self, is_melee: bool = True) -> ProcCoefficients:
+        return ProcCoefficients(PHYSICAL, ad_b=self.base_ad_ratio)
 
     @staticmethod
     def is_spellblade() -> bool:
         return True
 
 
-@dataclass
-class LichBane:
+@dataclass(slots=True, frozen=True)
+class LichBane(LinearProc):
     """Lich Bane — Spellblade.
 
     Stats: +85 AP, +8% MS.
@@ -301,10 +447,8 @@ class LichBane:
     ap_ratio: float = 0.40
     cooldown: float = 1.5
 
-    def proc_damage(self, champion, target, **ctx) -> dict:
-        ap = getattr(champion, 'total_AP', 0)
-        return {"raw_damage": champion.base_AD * self.base_ad_ratio + ap * self.ap_ratio,
-                "damage_type": "magic"}
+    def proc_coefficients(self, is_melee: bool = True) -> ProcCoefficients:
+        return ProcCoefficients(MAGIC, ad_b=self.base_ad_ratio, ap=self.ap_ratio)
 
     @staticmethod
     def is_spellblade() -> bool:
@@ -317,8 +461,8 @@ class LichBane:
 # ═══════════════════════════════════════════════════════════════════════
 
 
-@dataclass
-class VoltaicCyclosword:
+@dataclass(slots=True, frozen=True)
+class VoltaicCyclosword(FlatOnHit):
     """Voltaic Cyclosword — Firmament.
 
     Stats: +55 AD, +15% AS.
@@ -328,17 +472,16 @@ class VoltaicCyclosword:
     flat_damage: float = 100.0
     stacks_per_aa: int = 6
     max_stacks: int = 100
-
-    def proc_damage(self, champion, target, **ctx) -> dict:
-        return {"raw_damage": self.flat_damage, "damage_type": "physical"}
+    damage_type: ClassVar[str] = PHYSICAL
+    _FLAT_FIELD: ClassVar[str] = "flat_damage"
 
     @staticmethod
     def is_energized() -> bool:
         return True
 
 
-@dataclass
-class RapidFirecannon:
+@dataclass(slots=True, frozen=True)
+class RapidFirecannon(FlatOnHit):
     """Rapid Firecannon — Sharpshooter.
 
     Stats: +25% AS.
@@ -348,17 +491,16 @@ class RapidFirecannon:
     flat_damage: float = 40.0
     stacks_per_aa: int = 6
     max_stacks: int = 100
-
-    def proc_damage(self, champion, target, **ctx) -> dict:
-        return {"raw_damage": self.flat_damage, "damage_type": "magic"}
+    damage_type: ClassVar[str] = MAGIC
+    _FLAT_FIELD: ClassVar[str] = "flat_damage"
 
     @staticmethod
     def is_energized() -> bool:
         return True
 
 
-@dataclass
-class StatikkShiv:
+@dataclass(slots=True, frozen=True)
+class StatikkShiv(FlatOnHit):
     """Statikk Shiv — Electrospark.
 
     Stats: +45% AS.
@@ -369,17 +511,16 @@ class StatikkShiv:
     champ_damage: float = 60.0
     stacks_per_aa: int = 6
     max_stacks: int = 100
-
-    def proc_damage(self, champion, target, **ctx) -> dict:
-        return {"raw_damage": self.champ_damage, "damage_type": "magic"}
+    damage_type: ClassVar[str] = MAGIC
+    _FLAT_FIELD: ClassVar[str] = "champ_damage"
 
     @staticmethod
     def is_energized() -> bool:
         return True
 
 
-@dataclass
-class Stormrazor:
+@dataclass(slots=True, frozen=True)
+class Stormrazor(FlatOnHit):
     """Stormrazor — Bolt.
 
     Stats: +45 AD.
@@ -389,9 +530,8 @@ class Stormrazor:
     flat_damage: float = 100.0
     stacks_per_aa: int = 6
     max_stacks: int = 100
-
-    def proc_damage(self, champion, target, **ctx) -> dict:
-        return {"raw_damage": self.flat_damage, "damage_type": "magic"}
+    damage_type: ClassVar[str] = MAGIC
+    _FLAT_FIELD: ClassVar[str] = "flat_damage"
 
     @staticmethod
     def is_energized() -> bool:
@@ -403,7 +543,7 @@ class Stormrazor:
 # ═══════════════════════════════════════════════════════════════════════
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LordDominiksRegards:
     """Lord Dominik's Regards — Giant Slayer.
 
@@ -427,8 +567,8 @@ class LordDominiksRegards:
 # ═══════════════════════════════════════════════════════════════════════
 
 
-@dataclass
-class Stridebreaker:
+@dataclass(slots=True, frozen=True)
+class Stridebreaker(LinearProc):
     """Stridebreaker — Breaking Shockwave.
 
     Stats: +45 AD, +300 HP, +20% AS.
@@ -439,17 +579,16 @@ class Stridebreaker:
     ad_ratio: float = 0.80
     cooldown: float = 15.0
 
-    def proc_damage(self, champion, target, **ctx) -> dict:
-        return {"raw_damage": champion.total_AD * self.ad_ratio,
-                "damage_type": "physical"}
+    def proc_coefficients(self, is_melee: bool = True) -> ProcCoefficients:
+        return ProcCoefficients(PHYSICAL, ad_t=self.ad_ratio)
 
     @staticmethod
     def is_active() -> bool:
         return True
 
 
-@dataclass
-class ProfaneHydra:
+@dataclass(slots=True, frozen=True)
+class ProfaneHydra(LinearProc):
     """Profane Hydra — Heretical Cleave (active) + Cleave (passive).
 
     Stats: +60 AD, 15 ability haste, 18 lethality.
@@ -460,18 +599,17 @@ class ProfaneHydra:
     active_ad_ratio: float = 0.80
     cooldown: float = 10.0
 
-    def proc_damage(self, champion, target, **ctx) -> dict:
+    def proc_coefficients(self, is_melee: bool = True) -> ProcCoefficients:
         """Active damage (hits primary target in 1v1)."""
-        return {"raw_damage": champion.total_AD * self.active_ad_ratio,
-                "damage_type": "physical"}
+        return ProcCoefficients(PHYSICAL, ad_t=self.active_ad_ratio)
 
     @staticmethod
     def is_active() -> bool:
         return True
 
 
-@dataclass
-class RavenousHydra:
+@dataclass(slots=True, frozen=True)
+class RavenousHydra(LinearProc):
     """Ravenous Hydra — Ravenous Crescent (active) + Cleave (passive).
 
     Stats: +65 AD, 25 ability haste, 10% life steal.
@@ -482,18 +620,17 @@ class RavenousHydra:
     active_ad_ratio: float = 0.80
     cooldown: float = 10.0
 
-    def proc_damage(self, champion, target, **ctx) -> dict:
+    def proc_coefficients(self, is_melee: bool = True) -> ProcCoefficients:
         """Active damage (hits primary target in 1v1)."""
-        return {"raw_damage": champion.total_AD * self.active_ad_ratio,
-                "damage_type": "physical"}
+        return ProcCoefficients(PHYSICAL, ad_t=self.active_ad_ratio)
 
     @staticmethod
     def is_active() -> bool:
         return True
 
 
-@dataclass
-class HextechRocketbelt:
+@dataclass(slots=True, frozen=True)
+class HextechRocketbelt(LinearProc):
     """Hextech Rocketbelt — Supersonic.
 
     Stats: +80 AP, +300 HP, 15 ability haste.
@@ -504,18 +641,16 @@ class HextechRocketbelt:
     ap_ratio: float = 0.10
     cooldown: float = 40.0
 
-    def proc_damage(self, champion, target, **ctx) -> dict:
-        ap = getattr(champion, 'total_AP', 0)
-        return {"raw_damage": self.base_damage + ap * self.ap_ratio,
-                "damage_type": "magic"}
+    def proc_coefficients(self, is_melee: bool = True) -> ProcCoefficients:
+        return ProcCoefficients(MAGIC, flat=self.base_damage, ap=self.ap_ratio)
 
     @staticmethod
     def is_active() -> bool:
         return True
 
 
-@dataclass
-class Everfrost:
+@dataclass(slots=True, frozen=True)
+class Everfrost(LinearProc):
     """Everfrost — Glaciate.
 
     Stats: +70 AP, +300 HP, +600 mana, 25 ability haste.
@@ -526,10 +661,8 @@ class Everfrost:
     ap_ratio: float = 0.85
     cooldown: float = 30.0
 
-    def proc_damage(self, champion, target, **ctx) -> dict:
-        ap = getattr(champion, 'total_AP', 0)
-        return {"raw_damage": self.base_damage + ap * self.ap_ratio,
-                "damage_type": "magic"}
+    def proc_coefficients(self, is_melee: bool = True) -> ProcCoefficients:
+        return ProcCoefficients(MAGIC, flat=self.base_damage, ap=self.ap_ratio)
 
     @staticmethod
     def is_active() -> bool:
@@ -541,7 +674,7 @@ class Everfrost:
 # ═══════════════════════════════════════════════════════════════════════
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LiandrysTorment:
     """Liandry's Torment — Torment.
 
@@ -553,17 +686,21 @@ class LiandrysTorment:
     name: str = "Liandry's Torment"
     total_burn_pct: float = 0.06
 
-    def burn_damage(self, target, **ctx) -> dict:
+    def burn_damage(self, target, **ctx) -> ProcResult:
         """Total burn damage per ability hit (3s duration)."""
-        return {"raw_damage": target.max_hp * self.total_burn_pct,
-                "damage_type": "magic"}
+        return ProcResult(target.max_hp * self.total_burn_pct, MAGIC)
+
+    def burn_damage_vec(self, target_max_hps: Sequence[float]) -> List[float]:
+        """Raw burn damage per ability hit for each target max HP."""
+        pct = self.total_burn_pct
+        return [hp * pct for hp in target_max_hps]
 
     @staticmethod
     def is_burn() -> bool:
         return True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SunfireAegis:
     """Sunfire Aegis — Immolate.
 
@@ -575,17 +712,22 @@ class SunfireAegis:
     base_dps: float = 20.0
     bonus_hp_ratio: float = 0.01
 
-    def dps(self, champion, **ctx) -> float:
+    def dps(self, champion: ProcChampion, **ctx) -> float:
         """Magic DPS in combat (always-on aura)."""
-        bonus_hp = getattr(champion, 'bonus_HP', 0)
+        bonus_hp = champion.bonus_HP
         return self.base_dps + bonus_hp * self.bonus_hp_ratio
 
+    def dps_vec(self, bonus_hps: Sequence[float]) -> List[float]:
+        """Aura magic DPS for each bonus HP value."""
+        base, ratio = self.base_dps, self.bonus_hp_ratio
+        return [base + hp * ratio for hp in bonus_hps]
+
     @staticmethod
     def is_immolate() -> bool:
         return True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HollowRadiance:
     """Hollow Radiance — Immolate.
 
@@ -596,10 +738,15 @@ class HollowRadiance:
     base_dps: float = 15.0
     bonus_hp_ratio: float = 0.01
 
-    def dps(self, champion, **ctx) -> float:
-        bonus_hp = getattr(champion, 'bonus_HP', 0)
+    def dps(self, champion: ProcChampion, **ctx) -> float:
+        bonus_hp = champion.bonus_HP
         return self.base_dps + bonus_hp * self.bonus_hp_ratio
 
+    def dps_vec(self, bonus_hps: Sequence[float]) -> List[float]:
+        """Aura magic DPS for each bonus HP value."""
+        base, ratio = self.base_dps, self.bonus_hp_ratio
+        return [base + hp * ratio for hp in bonus_hps]
+
     @staticmethod
     def is_immolate() -> bool:
         return True
@@ -610,8 +757,8 @@ class HollowRadiance:
 # ═══════════════════════════════════════════════════════════════════════
 
 
-@dataclass
-class SunderedSky:
+@dataclass(slots=True, frozen=True)
+class SunderedSky(LinearProc):
     """Sundered Sky — Lightshield Strike.
 
     Stats: +50 AD, +300 HP.
@@ -626,14 +773,13 @@ class SunderedSky:
     missing_hp_heal_pct: float = 0.06
     cooldown: float = 10.0
 
-    def proc_damage(self, champion, target, **ctx) -> dict:
+    def proc_coefficients(self, is_melee: bool = True) -> ProcCoefficients:
         """Bonus crit damage on first hit (60% of total AD extra)."""
-        return {"raw_damage": champion.total_AD * self.crit_bonus_pct,
-                "damage_type": "physical"}
+        return ProcCoefficients(PHYSICAL, ad_t=self.crit_bonus_pct)
 
     def proc_heal(self, champion, current_hp: float = 0, max_hp: float = 0) -> float:
         """Heal on proc: base AD + 6% missing HP."""
-        is_melee = getattr(champion, 'is_melee', True)
+        is_melee = champion.is_melee
         ratio = self.melee_heal_ad_ratio if is_melee else self.ranged_heal_ad_ratio
         missing = max(max_hp - current_hp, 0)
         return champion.base_AD * ratio + missing * self.missing_hp_heal_pct
@@ -643,8 +789,8 @@ class SunderedSky:
         return True
 
 
-@dataclass
-class DeadMansPlate:
+@dataclass(slots=True, frozen=True)
+class DeadMansPlate(LinearProc):
     """Dead Man's Plate — Shipwrecker.
 
     Stats: +300 HP, +45 AR.
@@ -656,10 +802,9 @@ class DeadMansPlate:
     flat_damage: float = 40.0
     base_ad_ratio: float = 1.20
 
-    def proc_damage(self, champion, target, **ctx) -> dict:
+    def proc_coefficients(self, is_melee: bool = True) -> ProcCoefficients:
         """Full-momentum proc damage."""
-        return {"raw_damage": self.flat_damage + champion.base_AD * self.base_ad_ratio,
-                "damage_type": "physical"}
+        return ProcCoefficients(PHYSICAL, flat=self.flat_damage, ad_b=self.base_ad_ratio)
 
     @staticmethod
     def is_conditional() -> bool:
@@ -671,7 +816,7 @@ class DeadMansPlate:
 # ═══════════════════════════════════════════════════════════════════════
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Tiamat:
     """Tiamat — Cleave.
 
@@ -684,7 +829,7 @@ class Tiamat:
     name: str = "Tiamat"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GuinsoosRageblade:
     """Guinsoo's Rageblade — Seething Strike / Phantom Hit.
 
@@ -705,8 +850,8 @@ class GuinsoosRageblade:
         return True
 
 
-@dataclass
-class HextechGunblade:
+@dataclass(slots=True, frozen=True)
+class HextechGunblade(LinearProc):
     """Hextech Gunblade — Lightning Bolt.
 
     Stats: +40 AD, +60 AP.
@@ -718,11 +863,101 @@ class HextechGunblade:
     ap_ratio: float = 0.30
     cooldown: float = 40.0
 
-    def proc_damage(self, champion, target, **ctx) -> dict:
-        base = _level_scale(self.min_damage, self.max_damage, champion.level)
-        ap = getattr(champion, 'total_AP', 0)
-        return {"raw_damage": base + ap * self.ap_ratio, "damage_type": "magic"}
+    def proc_coefficients(self, is_melee: bool = True) -> ProcCoefficients:
+        return ProcCoefficients(MAGIC, ap=self.ap_ratio,
+                                lvl_lo=self.min_damage, lvl_hi=self.max_damage)
 
     @staticmethod
     def is_active() -> bool:
         return True
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# ITEM LOOKUP
+# ═══════════════════════════════════════════════════════════════════════
+
+# Item name → dataclass, for every item modeled in this module
+_ITEM_CLASSES = {
+    cls().name: cls
+    for cls in list(globals().values())
+    if isinstance(cls, type) and is_dataclass(cls) and cls.__module__ == __name__
+    and cls is not FlatOnHit
+}
+
+
+def _check_flat_fields():
+    """Each FlatOnHit item must take its amount as an ``__init__`` keyword
+    named by ``_FLAT_FIELD`` (``WitsEnd(flat_magic=50)``, ...)."""
+    for cls in _ITEM_CLASSES.values():
+        if issubclass(cls, FlatOnHit):
+            init_fields = {f.name for f in fields(cls) if f.init}
+            if cls._FLAT_FIELD not in init_fields:
+                raise TypeError(
+                    f"{cls.__name__}._FLAT_FIELD={cls._FLAT_FIELD!r} is not "
+                    f"an init field"
+                )
+            item = cls(**{cls._FLAT_FIELD: 1.0})
+            if item.flat != 1.0:
+                raise TypeError(f"{cls.__name__}.flat does not read {cls._FLAT_FIELD}")
+
+
+_check_flat_fields()
+
+
+@functools.cache
+def _shared_item(cls):
+    return cls()
+
+
+def get_item(name: str):
+    """Return the item instance for *name* (e.g. ``"Trinity Force"``).
+
+    Frozen items are shared: every call returns the same instance, so
+    build searches don't allocate a new object per evaluation.  Spear of
+    Shojin is mutable (stacks) and is created fresh each call.
+
+    Raises:
+        ValueError: If no item dataclass is named *name*.
+    """
+    cls = _ITEM_CLASSES.get(name)
+    if cls is None:
+        raise ValueError(f"Unknown item: {name!r}")
+    if cls is SpearOfShojin:
+        return SpearOfShojin()
+    return _shared_item(cls)
+
+
+@functools.cache
+def _build_item_modifiers(names: tuple, shojin_stacks: int,
+                          target_max_hp: float, your_max_hp: float) -> tuple:
+    mods = []
+    for name in names:
+        item = get_item(name)
+        if isinstance(item, SpearOfShojin):
+            shojin = SpearOfShojin(stacks=shojin_stacks)
+            if shojin.damage_amp() > 0:
+                mods.append(shojin.modifier_dict())
+        elif isinstance(item, LordDominiksRegards):
+            mod = item.modifier_dict(target_max_hp, your_max_hp)
+            if mod["amp"] > 0:
+                mods.append(mod)
+    return tuple(mods)
+
+
+def build_item_modifiers(names: Sequence[str], shojin_stacks: int = 0,
+                         target_max_hp: float = 0.0,
+                         your_max_hp: float = 0.0) -> tuple:
+    """Damage modifier dicts contributed by a build's amplifier items.
+
+    Covers Spear of Shojin (at *shojin_stacks*) and Lord Dominik's Regards
+    (from the HP difference); amps of 0 are left out.  Cached per
+    (sorted names, stacks, HP values), so permutations of the same build
+    share one entry; each call returns fresh copies of the cached dicts,
+    so callers may mutate them.
+
+    Raises:
+        ValueError: If a name is not a known item.
+    """
+    mods = _build_item_modifiers(tuple(sorted(names)), shojin_stacks,
+                                 target_max_hp, your_max_hp)
+    return tuple(dict(mod) for mod in mods)
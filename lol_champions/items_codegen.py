@@ -0,0 +1,115 @@
+"""Per-build proc functions generated at runtime.
+
+Once a build, level and melee/ranged flag are fixed, every item proc is a
+straight-line expression in a handful of champion/target stats.
+``compile_build()`` writes that expression out as Python source with the
+coefficients inlined as constants, compiles it once, and returns the
+function, so evaluating a whole build is a single call with no per-item
+dispatch or branching.
+
+Coefficients come from ``items_soa``, so the generated code always
+matches the item dataclasses.
+
+Usage::
+
+    procs = compile_build(("Blade of the Ruined King", "Wit's End"),
+                          is_melee=True, level=9)
+    raws = procs(fiora.base_AD, fiora.total_AD, fiora.total_AP,
+                 target.max_hp, fiora.total_HP)
+    # raws[i] is the raw damage of procs.names[i] (procs.damage_types[i])
+"""
+
+import functools
+from typing import Callable, Iterable
+
+from .items import _level_scale_vec
+from .items_soa import build_item_arrays
+
+# Argument name for each coefficient column in items_soa
+_ARGS = {
+    "ad_b": "base_ad",
+    "ad_t": "total_ad",
+    "ap": "total_ap",
+    "tgt_hp": "target_hp",
+    "self_hp": "self_hp",
+}
+
+
+def _term_source(arrays: dict, i: int, lvl_val: float) -> str:
+    """Source for the raw damage of the *i*-th proc in *arrays*."""
+    terms = []
+    flat = arrays["flat"][i] + lvl_val
+    if flat:
+        terms.append(repr(flat))
+    for field, arg in _ARGS.items():
+        coeff = arrays[field][i]
+        if coeff:
+            terms.append(f"{coeff!r} * {arg}")
+    return " + ".join(terms) or "0.0"
+
+
+@functools.cache
+def _compile_build(names: tuple, is_melee: bool, level: int) -> Callable:
+    arrays = build_item_arrays(names, is_melee)
+    lvl_vals = _level_scale_vec(arrays["lvl_lo"], arrays["lvl_hi"], level)
+    exprs = [_term_source(arrays, i, v) for i, v in enumerate(lvl_vals)]
+    body = "".join(f"\n        {e}," for e in exprs)
+    src = (
+        "def compute_build_procs(base_ad, total_ad, total_ap, target_hp, self_hp):\n"
+        f"    return ({body}\n    )\n"
+    )
+    ns: dict = {}
+    exec(compile(src, f"<build {' + '.join(arrays['names']) or 'empty'}>", "exec"), ns)
+    func = ns["compute_build_procs"]
+    func.names = arrays["names"]
+    func.damage_types = arrays["damage_type"]
+    func.source = src
+    return func
+
+
+def compile_build(items: Iterable[str], is_melee: bool = True,
+                  level: int = 1) -> Callable:
+    """Compile a build's item procs into one straight-line function.
+
+    Cached per (build, is_melee, level): the first call generates and
+    compiles the source, later calls return the same function.
+
+    Args:
+        items: Item names as used in ``ITEM_CATALOG``.  Items without a
+               damaging proc are skipped (see ``build_item_arrays``).
+        is_melee: Selects melee or ranged coefficients.
+        level: Champion level, for level-scaled procs (Kraken, Gunblade).
+
+    Returns:
+        ``compute_build_procs(base_ad, total_ad, total_ap, target_hp,
+        self_hp)`` returning a tuple of raw damages.  The function carries
+        ``names`` and ``damage_types`` tuples aligned with its result, and
+        its generated ``source``.
+    """
+    return _compile_build(tuple(items), is_melee, level)
+
+
+@functools.lru_cache(maxsize=4096)
+def proc_build_quantized(items: tuple, is_melee: bool, level: int,
+                         base_ad_q: int, total_ad_q: int, ap_q: int,
+                         target_hp_q: int, self_hp_q: int) -> tuple:
+    """Raw proc damages for a build at a quantized stat point (LRU cached).
+
+    AD and AP are passed in tenths and HP in whole points, so nearby stat
+    points a search revisits share one cache entry::
+
+        proc_build_quantized(names, fiora.is_melee, fiora.level,
+                             int(fiora.base_AD * 10), int(fiora.total_AD * 10),
+                             int(fiora.total_AP * 10),
+                             int(target.max_hp), int(fiora.total_HP))
+
+    Results are exact for the quantized inputs, i.e. within 0.1 AD/AP and
+    1 HP of the unquantized stats — use ``compile_build`` directly where
+    that matters.
+
+    Returns:
+        Tuple of raw damages aligned with ``compile_build(items).names``.
+    """
+    procs = _compile_build(items, is_melee, level)
+    return procs(base_ad_q / 10, total_ad_q / 10, ap_q / 10,
+                 float(target_hp_q), float(self_hp_q))
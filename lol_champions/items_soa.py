@@ -0,0 +1,167 @@
+"""Struct-of-arrays view over item proc formulas.
+
+Every ``proc_damage()`` in ``items.py`` is a linear combination of a few
+champion/target stats, described by the item's ``proc_coefficients()``.
+``build_item_arrays()`` flattens a build's proc coefficients into parallel
+tuples once per (build, melee/ranged) pair, so
+``proc_all()`` evaluates every proc in the build in one pass over plain
+floats instead of one method call + result allocation per item.
+
+The item dataclasses stay the source of truth — ``proc_damage()`` and the
+arrays here are both built from ``proc_coefficients()``, and an import-time
+check confirms ``proc_all()`` matches ``proc_damage()`` for every item.
+
+Usage::
+
+    arrays = build_item_arrays(("Blade of the Ruined King", "Wit's End"))
+    raws, types = proc_all(fiora, target, arrays)
+"""
+
+import functools
+import math
+from types import SimpleNamespace
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from .damage import DAMAGE_TYPE_IDS
+from .items import (
+    _ITEM_CLASSES, LinearProc, ProcCoefficients, _level_scale_vec, get_item,
+)
+
+
+# Item name → dataclass, for every item that exposes proc_coefficients()
+_PROC_CLASSES = {
+    name: cls for name, cls in _ITEM_CLASSES.items() if issubclass(cls, LinearProc)
+}
+
+# Coefficient fields (one parallel tuple each), see ``ProcCoefficients``
+_FIELDS = tuple(f for f in ProcCoefficients._fields if f != "damage_type")
+
+
+@functools.cache
+def _build_item_arrays(names: Tuple[str, ...], is_melee: bool) -> Dict[str, tuple]:
+    kept = [n for n in names if n in _PROC_CLASSES]
+    columns: Dict[str, list] = {f: [] for f in _FIELDS}
+    damage_types = []
+    for name in kept:
+        coeffs = get_item(name).proc_coefficients(is_melee)
+        for f in _FIELDS:
+            columns[f].append(getattr(coeffs, f))
+        damage_types.append(coeffs.damage_type)
+    arrays = {f: tuple(col) for f, col in columns.items()}
+    arrays["names"] = tuple(kept)
+    arrays["damage_type"] = tuple(damage_types)
+    arrays["damage_type_id"] = tuple(DAMAGE_TYPE_IDS[t] for t in damage_types)
+    return arrays
+
+
+def build_item_arrays(names: Iterable[str], is_melee: bool = True) -> Dict[str, tuple]:
+    """Flatten a build's proc coefficients into parallel tuples.
+
+    Cached per (build, is_melee), so repeated calls for the same build are
+    a dict lookup.  Names without a damaging proc (stat-only items, Spear of
+    Shojin, Lord Dominik's, burns/auras) are skipped.
+
+    Args:
+        names: Item names as used in ``ITEM_CATALOG``.
+        is_melee: Selects melee or ranged coefficients.
+
+    Returns:
+        Dict of equal-length tuples: ``names``, ``damage_type``,
+        ``damage_type_id`` (``DmgType``) and one tuple per coefficient field (``flat``, ``ad_b``, ``ad_t``, ``ap``,
+        ``tgt_hp``, ``self_hp``, ``lvl_lo``, ``lvl_hi``).
+    """
+    return _build_item_arrays(tuple(names), is_melee)
+
+
+def proc_all(champion, target, arrays: Dict[str, tuple],
+             target_current_hp: float = None) -> Tuple[List[float], Tuple[str, ...]]:
+    """Evaluate every proc in a build at once.
+
+    Matches calling ``proc_damage()`` on each item individually.
+
+    Args:
+        champion: Champion instance (reads base_AD, total_AD, total_AP,
+                  total_HP, level).
+        target: Target instance (max_hp used when no current HP given).
+        arrays: Output of ``build_item_arrays()``.
+        target_current_hp: Target current HP for % current HP procs (BotRK).
+
+    Returns:
+        (raw_damages, damage_types) aligned with ``arrays["names"]``.
+    """
+    base_ad = champion.base_AD
+    total_ad = champion.total_AD
+    total_ap = champion.total_AP
+    self_hp = champion.total_HP
+    tgt_hp = target.max_hp if target_current_hp is None else target_current_hp
+    lvl_vals = _level_scale_vec(arrays["lvl_lo"], arrays["lvl_hi"], champion.level)
+
+    raws = [
+        flat + ad_b * base_ad + ad_t * total_ad + ap * total_ap
+        + t_hp * tgt_hp + s_hp * self_hp + lvl_val
+        for flat, ad_b, ad_t, ap, t_hp, s_hp, lvl_val in zip(
+            arrays["flat"], arrays["ad_b"], arrays["ad_t"], arrays["ap"],
+            arrays["tgt_hp"], arrays["self_hp"], lvl_vals,
+        )
+    ]
+    return raws, arrays["damage_type"]
+
+
+def proc_damage_vec(arrays: Dict[str, tuple], levels: Sequence[int],
+                    base_ads: Sequence[float], total_ads: Sequence[float],
+                    total_aps: Sequence[float], target_hps: Sequence[float],
+                    self_hps: Sequence[float]) -> List[List[float]]:
+    """Evaluate every proc in a build across a sweep of stat points.
+
+    Point ``j`` of the sweep is (levels[j], base_ads[j], total_ads[j],
+    total_aps[j], target_hps[j], self_hps[j]) — e.g. one point per
+    champion level 1-18.  Level-scaled values are computed once per
+    distinct level.
+
+    Args:
+        arrays: Output of ``build_item_arrays()``.
+        levels, base_ads, total_ads, total_aps, target_hps, self_hps:
+            Equal-length sequences, one entry per sweep point.
+
+    Returns:
+        One list per proc (aligned with ``arrays["names"]``), each holding
+        that proc's raw damage at every sweep point.
+    """
+    lvl_cache = {
+        lvl: _level_scale_vec(arrays["lvl_lo"], arrays["lvl_hi"], lvl)
+        for lvl in set(levels)
+    }
+    points = list(zip(levels, base_ads, total_ads, total_aps, target_hps, self_hps))
+    return [
+        [
+            flat + ad_b * b_ad + ad_t * t_ad + ap * t_ap + t_hp * tgt + s_hp * own
+            + lvl_cache[lvl][i]
+            for lvl, b_ad, t_ad, t_ap, tgt, own in points
+        ]
+        for i, (flat, ad_b, ad_t, ap, t_hp, s_hp) in enumerate(zip(
+            arrays["flat"], arrays["ad_b"], arrays["ad_t"], arrays["ap"],
+            arrays["tgt_hp"], arrays["self_hp"],
+        ))
+    ]
+
+
+def _check_proc_all():
+    """``proc_all()`` must agree with each item's own ``proc_damage()``."""
+    target = SimpleNamespace(max_hp=2500.0)
+    for is_melee in (True, False):
+        champion = SimpleNamespace(base_AD=68.0, total_AD=187.0, total_AP=95.0,
+                                   total_HP=2140.0, bonus_HP=780.0,
+                                   is_melee=is_melee, level=11)
+        names = tuple(_PROC_CLASSES)
+        raws, types = proc_all(champion, target, build_item_arrays(names, is_melee))
+        for name, raw, damage_type in zip(names, raws, types):
+            proc = get_item(name).proc_damage(champion, target)
+            if (proc.damage_type != damage_type
+                    or not math.isclose(proc.raw_damage, raw, rel_tol=1e-9)):
+                raise TypeError(
+                    f"proc_all() disagrees with {name} proc_damage() "
+                    f"({raw!r} {damage_type} vs {proc.raw_damage!r} {proc.damage_type})"
+                )
+
+
+_check_proc_all()
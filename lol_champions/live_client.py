@@ -4,36 +4,160 @@ Communicates with the in-game client at https://127.0.0.1:2999 to read
 real-time player stats, items, abilities, and runes.  Only available
 while a game is in progress.  No authentication required.
 
-Uses stdlib only (urllib + ssl + json).
+Uses stdlib only (http.client + ssl + json).  Requests share one
+keep-alive HTTPS connection, so polling does not pay a TCP connect and
+TLS handshake per call.  If ``orjson`` is installed it is used to parse
+responses; otherwise the stdlib ``json`` module is used.
 """
 
-import json
+import asyncio
+import http.client
 import ssl
-import urllib.request
+import functools
+import threading
+import time
 import urllib.error
 
-BASE_URL = "https://127.0.0.1:2999/liveclientdata"
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+HOST = "127.0.0.1"
+PORT = 2999
+BASE_PATH = "/liveclientdata"
+BASE_URL = f"https://{HOST}:{PORT}{BASE_PATH}"
 
 # Reusable SSL context — the game client uses a self-signed certificate.
 _ssl_ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
 _ssl_ctx.check_hostname = False
 _ssl_ctx.verify_mode = ssl.CERT_NONE
 
+# Persistent connection, opened lazily and shared across threads.
+_conn: http.client.HTTPSConnection | None = None
+_conn_lock = threading.Lock()
+
+
+def _reset_conn() -> None:
+    """Close and drop the shared connection (caller holds the lock)."""
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
+
+
+def _request(endpoint: str, timeout: float) -> bytes:
+    """One GET over the shared connection (caller holds the lock)."""
+    global _conn
+    if _conn is None:
+        _conn = http.client.HTTPSConnection(HOST, PORT, context=_ssl_ctx,
+                                            timeout=timeout)
+    else:
+        _conn.timeout = timeout
+        if _conn.sock is not None:
+            _conn.sock.settimeout(timeout)
+    _conn.request("GET", f"{BASE_PATH}/{endpoint}")
+    resp = _conn.getresponse()
+    data = resp.read()
+    if resp.status != 200:
+        raise urllib.error.HTTPError(f"{BASE_URL}/{endpoint}", resp.status,
+                                     resp.reason, resp.headers, None)
+    return data
+
 
 def _get(endpoint: str, timeout: float = 2.0) -> dict | list:
-    """GET *endpoint* and return parsed JSON."""
-    url = f"{BASE_URL}/{endpoint}"
-    req = urllib.request.Request(url)
-    with urllib.request.urlopen(req, timeout=timeout, context=_ssl_ctx) as resp:
-        return json.loads(resp.read().decode())
+    """GET *endpoint* and return parsed JSON.
+
+    A dropped keep-alive connection is reopened and the request retried
+    once.  Other failures reset the connection and propagate.  Any failure
+    also drops the TTL-cached ``is_game_active``/``get_game_stats``
+    answers, so a game that just ended is not reported as running.
+    """
+    try:
+        with _conn_lock:
+            try:
+                data = _request(endpoint, timeout)
+            except (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                    ConnectionResetError, BrokenPipeError):
+                _reset_conn()
+                try:
+                    data = _request(endpoint, timeout)
+                except BaseException:
+                    _reset_conn()
+                    raise
+            except urllib.error.HTTPError:
+                raise
+            except BaseException:
+                _reset_conn()
+                raise
+    except BaseException:
+        _probe_game.cache_clear()
+        get_game_stats.cache_clear()
+        raise
+    return _loads(data)
+
+
+# Guards every _ttl_cache entry.  Held only to read or write an entry,
+# never across a request, so clearing one cache from inside another
+# cached call cannot deadlock.
+_cache_lock = threading.Lock()
+
+
+def _ttl_cache(ttl_s: float):
+    """Cache a zero-argument function's result for *ttl_s* seconds.
+
+    Results can be up to *ttl_s* old.  Exceptions are never cached: a
+    failed call clears the entry so the next call goes back to the
+    network.  The wrapper gains a ``cache_clear()`` method.
+
+    The call itself runs without any lock held, so concurrent misses may
+    both reach the network.  A result is only stored if the cache was not
+    cleared while the call was in flight.
+    """
+    def decorator(func):
+        entry = []      # [value, expires_at] once populated
+        generation = [0]
+
+        @functools.wraps(func)
+        def wrapper():
+            with _cache_lock:
+                if entry and time.monotonic() < entry[1]:
+                    return entry[0]
+                entry.clear()
+                started = generation[0]
+            value = func()
+            with _cache_lock:
+                if generation[0] == started:
+                    entry[:] = [value, time.monotonic() + ttl_s]
+            return value
+
+        def cache_clear():
+            with _cache_lock:
+                entry.clear()
+                generation[0] += 1
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+@_ttl_cache(1.0)
+def _probe_game() -> bool:
+    _get("gamestats", timeout=1.0)
+    return True
 
 
 def is_game_active() -> bool:
-    """Return True if a League game is currently running."""
+    """Return True if a League game is currently running.
+
+    A positive answer is cached for 1s, so it can be up to 1s old.  Failed
+    probes are not cached, and any failed Live Client request clears the
+    cached answer, so a game that just ended is detected on the next call
+    after its first failing request.
+    """
     try:
-        _get("gamestats", timeout=1.0)
-        return True
-    except (urllib.error.URLError, OSError):
+        return _probe_game()
+    except (urllib.error.URLError, http.client.HTTPException, OSError):
         return False
 
 
@@ -55,11 +179,41 @@ def get_player_list() -> list:
     return _get("playerlist")
 
 
+@_ttl_cache(0.25)
 def get_game_stats() -> dict:
-    """Game metadata: ``gameMode``, ``gameTime``, ``mapName``."""
+    """Game metadata: ``gameMode``, ``gameTime``, ``mapName``.
+
+    Cached for 0.25s, so results can be up to 0.25s old; a failed
+    request clears the cache.
+    """
     return _get("gamestats")
 
 
 def get_active_player_name() -> str:
     """Return the active player's Riot ID (name#tag)."""
     return _get("activeplayername")
+
+
+def snapshot_sync() -> dict:
+    """Everything the poll loop needs, in a single request.
+
+    Reads ``allgamedata``, which bundles the other endpoints, so one poll
+    costs one round trip instead of one per getter.
+
+    Returns a dict with keys ``active_player`` (as ``get_active_player``),
+    ``player_list`` (as ``get_player_list``), ``game_stats`` (as
+    ``get_game_stats``) and ``active_player_name``.
+    """
+    data = _get("allgamedata")
+    active = data.get("activePlayer", {})
+    return {
+        "active_player": active,
+        "player_list": data.get("allPlayers", []),
+        "game_stats": data.get("gameData", {}),
+        "active_player_name": active.get("riotId", "") or active.get("summonerName", ""),
+    }
+
+
+async def snapshot() -> dict:
+    """Async variant of ``snapshot_sync()`` (runs in a worker thread)."""
+    return await asyncio.to_thread(snapshot_sync)
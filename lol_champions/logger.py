@@ -16,6 +16,7 @@ Usage::
     log_build_results(builds, champion=fiora, target=target, rune="PtA")
 """
 
+import functools
 import os
 from datetime import datetime
 from pathlib import Path
@@ -23,73 +24,127 @@ from typing import Any, Dict, List
 
 LOG_DIR = Path(__file__).resolve().parent.parent / "logs"
 
+# Write buffer for build reports — large enough that a typical report is
+# flushed in one syscall.
+_WRITE_BUFFER = 1 << 20
+
+# Bound once so each log call skips the datetime attribute lookup
+_now = datetime.now
+
+# One row of the build rankings table
+_RANK_FMT = ("  #{i:2d}: {names:50s}  {dps:>7.1f} DPS  "
+             "({dmg:>7.1f} dmg, {heal:>6.1f} heal)")
+
+
+# LOG_DIR value already created this process (re-checked if LOG_DIR changes)
+_log_dir_ready = None
+
 
 def _ensure_log_dir():
-    """Create the logs directory if it doesn't exist."""
-    LOG_DIR.mkdir(parents=True, exist_ok=True)
+    """Create the logs directory if it doesn't exist (once per process)."""
+    global _log_dir_ready
+    if _log_dir_ready != LOG_DIR:
+        LOG_DIR.mkdir(parents=True, exist_ok=True)
+        _log_dir_ready = LOG_DIR
 
 
-def _champion_header(champion) -> str:
-    """Format champion info as a header block."""
+@functools.lru_cache(maxsize=128)
+def _fmt_champion_header(name, level, ad, ap, hp, ar, mr, attack_speed,
+                         lethality, armor_pen_pct, life_steal, omnivamp,
+                         abilities) -> str:
     lines = []
-    name = type(champion).__name__
-    lines.append(f"Champion: {name} Level {champion.level}")
-    lines.append(f"  AD: {champion.total_AD:.1f}  AP: {champion.total_AP:.1f}  "
-                 f"HP: {champion.total_HP:.1f}  AR: {champion.total_AR:.1f}  "
-                 f"MR: {champion.total_MR:.1f}")
-    lines.append(f"  AS: {champion.total_attack_speed():.3f}  "
-                 f"Lethality: {champion.lethality:.1f}  "
-                 f"Armor Pen %: {champion.armor_pen_pct:.0%}  "
-                 f"Life Steal: {champion.life_steal:.0%}  "
-                 f"Omnivamp: {champion.omnivamp:.0%}")
-    # Abilities
+    lines.append(f"Champion: {name} Level {level}")
+    lines.append(f"  AD: {ad:.1f}  AP: {ap:.1f}  "
+                 f"HP: {hp:.1f}  AR: {ar:.1f}  "
+                 f"MR: {mr:.1f}")
+    lines.append(f"  AS: {attack_speed:.3f}  "
+                 f"Lethality: {lethality:.1f}  "
+                 f"Armor Pen %: {armor_pen_pct:.0%}  "
+                 f"Life Steal: {life_steal:.0%}  "
+                 f"Omnivamp: {omnivamp:.0%}")
+    if abilities:
+        lines.append(f"  Abilities: {' '.join(abilities)}")
+    return "\n".join(lines)
+
+
+def _champion_header(champion) -> str:
+    """Format champion info as a header block.
+
+    The formatted block is cached on the champion's displayed stats, so
+    logging many results for the same champion state formats it once.
+    """
     abilities = []
     for attr in ('q_ability', 'w_ability', 'e_ability', 'r_ability'):
         ab = getattr(champion, attr, None)
         if ab:
             abilities.append(f"{ab.name[0]}[{ab.current_level}]")
-    if abilities:
-        lines.append(f"  Abilities: {' '.join(abilities)}")
-    return "\n".join(lines)
+    return _fmt_champion_header(
+        type(champion).__name__, champion.level,
+        champion.total_AD, champion.total_AP, champion.total_HP,
+        champion.total_AR, champion.total_MR,
+        champion.total_attack_speed(), champion.lethality,
+        champion.armor_pen_pct, champion.life_steal, champion.omnivamp,
+        tuple(abilities),
+    )
+
+
+# typed: the values are printed as-is, so 2000 and 2000.0 must not share
+@functools.lru_cache(maxsize=128, typed=True)
+def _fmt_target_header(max_hp, armor, mr) -> str:
+    return f"Target: HP={max_hp}  Armor={armor}  MR={mr}"
 
 
 def _target_header(target) -> str:
     """Format target info."""
-    return f"Target: HP={target.max_hp}  Armor={target.armor}  MR={target.mr}"
+    return _fmt_target_header(target.max_hp, target.armor, target.mr)
 
 
 def _format_timeline(result: dict) -> str:
     """Format the full timeline as readable text."""
-    lines = []
-    lines.append("Timeline:")
-    for e in result["timeline"]:
-        notes = e["notes"] if e["notes"] else ""
-        lines.append(f"  {e['time']:6.2f}s  {e['action']:12s}  "
-                     f"dmg={e['damage']:>7.1f}  heal={e['healing']:>6.1f}  "
-                     f"{notes}")
-    return "\n".join(lines)
+    return "Timeline:" + "".join([
+        f"\n  {e['time']:6.2f}s  {e['action']:12s}  "
+        f"dmg={e['damage']:>7.1f}  heal={e['healing']:>6.1f}  "
+        f"{e['notes'] or ''}"
+        for e in result["timeline"]
+    ])
+
+
+def _build_str_from_names(names) -> str:
+    """Build label for a list of item names."""
+    return " + ".join(names) if names else "(no items)"
+
+
+def _build_str_from_instances(items) -> str:
+    """Build label for a list of item instances."""
+    return " + ".join(type(i).__name__ for i in items) if items else "(no items)"
+
 
+def _slug_from_names(names) -> str:
+    """Filename slug from the first three item names."""
+    if not names:
+        return "no_items"
+    return "_".join(n.replace(" ", "").replace("'", "")[:10] for n in names[:3])
 
-def _format_single_result(result: dict, items=None, rune=None) -> str:
+
+def _slug_from_instances(items) -> str:
+    """Filename slug from the first three item instances."""
+    if not items:
+        return "no_items"
+    return "_".join(type(i).__name__[:10] for i in items[:3])
+
+
+def _rune_str(rune) -> str:
+    """Rune label from a rune name or instance."""
+    if not rune:
+        return ""
+    return rune if isinstance(rune, str) else type(rune).__name__
+
+
+def _format_single_result(result: dict, build_str: str, rune_str: str = "") -> str:
     """Format a single optimize_dps result as a full log entry."""
     lines = []
 
     # Build header
-    if items:
-        if isinstance(items[0], str):
-            build_str = " + ".join(items)
-        else:
-            build_str = " + ".join(type(i).__name__ for i in items)
-    else:
-        build_str = "(no items)"
-
-    rune_str = ""
-    if rune:
-        if isinstance(rune, str):
-            rune_str = rune
-        else:
-            rune_str = type(rune).__name__
-
     lines.append(f"{build_str}" + (f" — {rune_str}" if rune_str else ""))
     lines.append(f"Total: {result['total_damage']} dmg | "
                  f"{result['dps']} DPS | "
@@ -101,46 +156,20 @@ def _format_single_result(result: dict, items=None, rune=None) -> str:
     return "\n".join(lines)
 
 
-def log_result(
-    result: dict,
-    champion=None,
-    target=None,
-    items=None,
-    rune=None,
-    filename: str = None,
-) -> str:
-    """Log a single optimize_dps result to a file.
-
-    Args:
-        result: Dict returned by optimize_dps().
-        champion: Champion instance (for header info).
-        target: Target instance (for header info).
-        items: Item names (list of str) or item instances.
-        rune: Rune name (str) or rune instance.
-        filename: Custom filename. Auto-generated if None.
-
-    Returns:
-        Path to the written log file.
-    """
+def _write_result_log(result: dict, champion, target, build_str: str,
+                      slug: str, rune_str: str, filename: str) -> str:
+    """Write one result log once the build label and slug are known."""
     _ensure_log_dir()
+    now = _now()
 
     if filename is None:
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        if items:
-            if isinstance(items[0], str):
-                slug = "_".join(n.replace(" ", "").replace("'", "")[:10]
-                                for n in items[:3])
-            else:
-                slug = "_".join(type(i).__name__[:10] for i in items[:3])
-        else:
-            slug = "no_items"
-        filename = f"{ts}_{slug}.log"
+        filename = f"{now.strftime('%Y%m%d_%H%M%S')}_{slug}.log"
 
     path = LOG_DIR / filename
 
     lines = []
     lines.append("=" * 70)
-    lines.append(f"LOG: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    lines.append(f"LOG: {now.strftime('%Y-%m-%d %H:%M:%S')}")
     lines.append("=" * 70)
 
     if champion:
@@ -151,16 +180,79 @@ def log_result(
 
     lines.append("")
     lines.append("-" * 70)
-    lines.append(_format_single_result(result, items=items, rune=rune))
+    lines.append(_format_single_result(result, build_str, rune_str))
     lines.append("-" * 70)
     lines.append("")
 
-    with open(path, "w") as f:
-        f.write("\n".join(lines))
+    # Written as bytes, like build reports, so every log uses LF line
+    # endings regardless of platform.
+    path.write_bytes("\n".join(lines).encode("utf-8"))
 
     return str(path)
 
 
+def log_result_by_names(
+    result: dict,
+    champion=None,
+    target=None,
+    names: List[str] = None,
+    rune=None,
+    filename: str = None,
+) -> str:
+    """Log a single optimize_dps result for a build given as item names.
+
+    Same as ``log_result`` without the per-call item type check.
+    """
+    return _write_result_log(result, champion, target,
+                             _build_str_from_names(names),
+                             _slug_from_names(names),
+                             _rune_str(rune), filename)
+
+
+def log_result_by_instances(
+    result: dict,
+    champion=None,
+    target=None,
+    items: list = None,
+    rune=None,
+    filename: str = None,
+) -> str:
+    """Log a single optimize_dps result for a build given as item instances.
+
+    Same as ``log_result`` without the per-call item type check.
+    """
+    return _write_result_log(result, champion, target,
+                             _build_str_from_instances(items),
+                             _slug_from_instances(items),
+                             _rune_str(rune), filename)
+
+
+def log_result(
+    result: dict,
+    champion=None,
+    target=None,
+    items=None,
+    rune=None,
+    filename: str = None,
+) -> str:
+    """Log a single optimize_dps result to a file.
+
+    Args:
+        result: Dict returned by optimize_dps().
+        champion: Champion instance (for header info).
+        target: Target instance (for header info).
+        items: Item names (list of str) or item instances.
+        rune: Rune name (str) or rune instance.
+        filename: Custom filename. Auto-generated if None.
+
+    Returns:
+        Path to the written log file.
+    """
+    if items and not isinstance(items[0], str):
+        return log_result_by_instances(result, champion, target, items, rune, filename)
+    return log_result_by_names(result, champion, target, items, rune, filename)
+
+
 def log_build_results(
     builds: List[Dict[str, Any]],
     champion=None,
@@ -183,21 +275,20 @@ def log_build_results(
         Path to the written log file.
     """
     _ensure_log_dir()
+    now = _now()
 
     if filename is None:
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        ts = now.strftime("%Y%m%d_%H%M%S")
         n_items = len(builds[0]["items"]) if builds else 0
         filename = f"{ts}_build_{n_items}items.log"
 
     path = LOG_DIR / filename
 
-    rune_str = ""
-    if rune:
-        rune_str = rune if isinstance(rune, str) else type(rune).__name__
+    rune_str = _rune_str(rune)
 
     lines = []
     lines.append("=" * 70)
-    lines.append(f"BUILD OPTIMIZER LOG: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    lines.append(f"BUILD OPTIMIZER LOG: {now.strftime('%Y-%m-%d %H:%M:%S')}")
     lines.append("=" * 70)
 
     if champion:
@@ -215,22 +306,33 @@ def log_build_results(
     lines.append("RANKINGS")
     lines.append("=" * 70)
 
+    build_strs = []
+    rank_row = _RANK_FMT.format
     for i, b in enumerate(builds, 1):
         names = " + ".join(b["items"])
-        lines.append(f"  #{i:2d}: {names:50s}  {b['dps']:>7.1f} DPS  "
-                     f"({b['total_damage']:>7.1f} dmg, {b['total_healing']:>6.1f} heal)")
-
-    # Detailed timeline for each build
-    for i, b in enumerate(builds, 1):
-        lines.append("")
-        lines.append("=" * 70)
-        lines.append(f"#{i} DETAIL")
-        lines.append("=" * 70)
-        lines.append(_format_single_result(b, items=b["items"], rune=rune))
-
-    lines.append("")
-
-    with open(path, "w") as f:
-        f.write("\n".join(lines))
+        build_strs.append(names or "(no items)")
+        lines.append(rank_row(i=i, names=names, dps=b["dps"],
+                              dmg=b["total_damage"], heal=b["total_healing"]))
+
+    # Detailed timeline for each build — written one build at a time so
+    # large reports are never held in memory as a single list.  Reports
+    # can run to megabytes, so each block is encoded once and written in
+    # binary mode, skipping the text-layer encoder.
+    # Same layout as _format_single_result, inlined into one f-string per
+    # build.
+    rule = "=" * 70
+    rune_suffix = f" — {rune_str}" if rune_str else ""
+    with open(path, "wb", buffering=_WRITE_BUFFER) as f:
+        f.write("\n".join(lines).encode("utf-8"))
+        for i, (b, build_str) in enumerate(zip(builds, build_strs), 1):
+            f.write((
+                f"\n\n{rule}\n#{i} DETAIL\n{rule}\n"
+                f"{build_str}{rune_suffix}\n"
+                f"Total: {b['total_damage']} dmg | {b['dps']} DPS | "
+                f"{b['total_healing']} heal\n"
+                f"Sequence: {b['sequence']}\n\n"
+                f"{_format_timeline(b)}"
+            ).encode("utf-8"))
+        f.write(b"\n")
 
     return str(path)
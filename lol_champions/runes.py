@@ -1,12 +1,15 @@
 """Keystone rune calculators for League of Legends.
 
 All values sourced from https://wiki.leagueoflegends.com/en-us/
-Rune proc dicts include 'raw_damage' and 'damage_type' keys so they can
-be passed directly to calculate_damage().
+Rune procs are returned as ``RuneProc`` / ``ProcResult`` named tuples
+(with 'raw_damage' and 'damage_type' keys) so they can be passed directly
+to calculate_damage().
 """
 
 from dataclasses import dataclass
-from typing import Dict, Any
+from typing import Any, Callable, Dict
+
+from .damage import ProcResult, RuneProc, PHYSICAL, MAGIC
 
 
 def _level_scale(min_val: float, max_val: float, level: int, max_level: int = 18) -> float:
@@ -22,16 +25,26 @@ def _level_scale(min_val: float, max_val: float, level: int, max_level: int = 18
         max_level: Level at which max_val is reached (default 18)
 
     Returns:
-        Interpolated value, rounded to 2 decimal places
+        Interpolated value (unrounded; round at display time)
     """
     clamped = max(1, min(level, max_level))
     if max_level <= 1:
-        return round(min_val, 2)
+        return min_val
     value = min_val + (max_val - min_val) * (clamped - 1) / (max_level - 1)
-    return round(value, 2)
+    return value
+
+
+def _level_table(min_val: float, max_val: float) -> tuple:
+    """``_level_scale`` precomputed for levels 1-18 (index = level - 1)."""
+    return tuple(_level_scale(min_val, max_val, lvl) for lvl in range(1, 19))
+
+
+def _level_index(level: int) -> int:
+    """Index into a ``_level_table`` for *level*, clamped like ``_level_scale``."""
+    return 0 if level < 1 else (17 if level > 18 else level - 1)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PressTheAttack:
     """Press the Attack (Precision keystone).
 
@@ -45,8 +58,10 @@ class PressTheAttack:
     """
     name: str = "Press the Attack"
     keystone_type: str = "Precision"
+    # Proc damage by level
+    _PROC_TABLE = _level_table(40.0, 174.12)
 
-    def proc_damage(self, champion_level: int, bonus_ad: float = 0.0, bonus_ap: float = 0.0) -> Dict[str, Any]:
+    def proc_damage(self, champion_level: int, bonus_ad: float = 0.0, bonus_ap: float = 0.0) -> RuneProc:
         """Calculate the proc damage when 3rd basic attack lands.
 
         Args:
@@ -55,16 +70,32 @@ class PressTheAttack:
             bonus_ap: Champion's bonus AP (for adaptive type resolution)
 
         Returns:
-            Dict with raw_damage, damage_type, cooldown
+            RuneProc with raw_damage, damage_type, cooldown
         """
-        damage = _level_scale(40.0, 174.12, champion_level)
-        adaptive = "physical" if bonus_ad >= bonus_ap else "magic"
-        return {
-            "raw_damage": damage,
-            "damage_type": adaptive,
-            "cooldown": 6.0,
-            "description": f"3-hit proc: {damage} {adaptive} damage",
-        }
+        damage = self._PROC_TABLE[_level_index(champion_level)]
+        adaptive = PHYSICAL if bonus_ad >= bonus_ap else MAGIC
+        return RuneProc(damage, adaptive, 6.0)
+
+    def bind(self, champion) -> Callable[[int], RuneProc]:
+        """Specialize ``proc_damage`` for *champion*'s current bonus stats.
+
+        Resolves the adaptive damage type once and returns a callable
+        ``proc(champion_level)`` producing the same ``RuneProc`` as
+        ``proc_damage``.  Re-bind after the champion's bonus AD/AP change.
+        """
+        table = self._PROC_TABLE
+        adaptive = PHYSICAL if champion.bonus_AD >= champion.bonus_AP else MAGIC
+
+        def proc(champion_level: int) -> RuneProc:
+            return RuneProc(table[_level_index(champion_level)], adaptive, 6.0)
+        return proc
+
+    def describe_proc(self, champion_level: int, bonus_ad: float = 0.0,
+                      bonus_ap: float = 0.0) -> str:
+        """Human-readable summary of ``proc_damage()`` (same arguments)."""
+        proc = self.proc_damage(champion_level, bonus_ad, bonus_ap)
+        # proc_damage() is unrounded; round for display only
+        return f"3-hit proc: {round(proc.raw_damage, 2)} {proc.damage_type} damage"
 
     def exposure(self) -> Dict[str, Any]:
         """The Exposed debuff applied after proc.
@@ -79,7 +110,7 @@ class PressTheAttack:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Conqueror:
     """Conqueror (Precision keystone).
 
@@ -97,6 +128,9 @@ class Conqueror:
     name: str = "Conqueror"
     keystone_type: str = "Precision"
     max_stacks: int = 12
+    # Adaptive force per stack by level
+    _AD_PER_STACK = _level_table(1.08, 2.56)
+    _AP_PER_STACK = _level_table(1.8, 4.26)
 
     def stat_bonus(self, champion_level: int, stacks: int, adaptive: str = "ad") -> Dict[str, Any]:
         """Calculate bonus AD or AP from Conqueror stacks.
@@ -112,19 +146,19 @@ class Conqueror:
         stacks = max(0, min(stacks, self.max_stacks))
 
         if adaptive == "ad":
-            per_stack = _level_scale(1.08, 2.56, champion_level)
+            per_stack = self._AD_PER_STACK[_level_index(champion_level)]
             return {
-                "bonus_AD": round(per_stack * stacks, 2),
+                "bonus_AD": per_stack * stacks,
                 "bonus_AP": 0.0,
                 "per_stack_AD": per_stack,
                 "stacks": stacks,
                 "is_fully_stacked": stacks == self.max_stacks,
             }
         else:
-            per_stack = _level_scale(1.8, 4.26, champion_level)
+            per_stack = self._AP_PER_STACK[_level_index(champion_level)]
             return {
                 "bonus_AD": 0.0,
-                "bonus_AP": round(per_stack * stacks, 2),
+                "bonus_AP": per_stack * stacks,
                 "per_stack_AP": per_stack,
                 "stacks": stacks,
                 "is_fully_stacked": stacks == self.max_stacks,
@@ -143,7 +177,7 @@ class Conqueror:
             Dict with heal amount
         """
         heal_pct = 0.08 if is_melee else 0.05
-        heal = round(post_mitigation_damage * heal_pct, 2)
+        heal = post_mitigation_damage * heal_pct
         return {
             "heal": heal,
             "heal_pct": f"{int(heal_pct * 100)}%",
@@ -151,7 +185,7 @@ class Conqueror:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HailOfBlades:
     """Hail of Blades (Domination keystone).
 
@@ -166,6 +200,11 @@ class HailOfBlades:
     """
     name: str = "Hail of Blades"
     keystone_type: str = "Domination"
+    # Bonus attack speed (%) by range type, and the stacks/duration granted
+    _MELEE_BONUS_AS = 160
+    _RANGED_BONUS_AS = 80
+    _INITIAL_STACKS = 2
+    _DURATION = 3.0
 
     def attack_speed_bonus(self, is_melee: bool = True) -> Dict[str, Any]:
         """Calculate the bonus attack speed granted.
@@ -176,19 +215,24 @@ class HailOfBlades:
         Returns:
             Dict with bonus_attack_speed, stacks, cooldown, duration
         """
-        bonus = 160 if is_melee else 80
+        bonus = self._MELEE_BONUS_AS if is_melee else self._RANGED_BONUS_AS
         return {
             "bonus_attack_speed": f"{bonus}%",
             "bonus_attack_speed_value": bonus,
-            "initial_stacks": 2,
-            "duration": 3.0,
+            "initial_stacks": self._INITIAL_STACKS,
+            "duration": self._DURATION,
             "cooldown": 10.0,
             "can_exceed_cap": True,
-            "description": f"{bonus}% bonus attack speed for 3s (2 stacks + resets)",
         }
 
+    def describe(self, is_melee: bool = True) -> str:
+        """Human-readable summary of ``attack_speed_bonus()``."""
+        bonus = self._MELEE_BONUS_AS if is_melee else self._RANGED_BONUS_AS
+        return (f"{bonus}% bonus attack speed for {self._DURATION:g}s "
+                f"({self._INITIAL_STACKS} stacks + resets)")
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GraspOfTheUndying:
     """Grasp of the Undying (Resolve keystone).
 
@@ -204,8 +248,11 @@ class GraspOfTheUndying:
     """
     name: str = "Grasp of the Undying"
     keystone_type: str = "Resolve"
+    # Proc damage as % of the user's max HP, by range type
+    _MELEE_HP_PCT = 3.5
+    _RANGED_HP_PCT = 1.4
 
-    def proc_damage(self, champion_max_hp: float, is_melee: bool = True) -> Dict[str, Any]:
+    def proc_damage(self, champion_max_hp: float, is_melee: bool = True) -> ProcResult:
         """Calculate proc damage based on the user's max HP.
 
         Args:
@@ -213,16 +260,15 @@ class GraspOfTheUndying:
             is_melee: True for melee (3.5%), False for ranged (1.4%)
 
         Returns:
-            Dict with raw_damage, damage_type (always magic)
+            ProcResult with raw_damage, damage_type (always magic)
         """
-        pct = 3.5 if is_melee else 1.4
-        damage = round(champion_max_hp * pct / 100, 2)
-        return {
-            "raw_damage": damage,
-            "damage_type": "magic",
-            "hp_pct": f"{pct}%",
-            "description": f"{pct}% max HP as magic damage",
-        }
+        pct = self._MELEE_HP_PCT if is_melee else self._RANGED_HP_PCT
+        return ProcResult(champion_max_hp * pct / 100, MAGIC)
+
+    def describe_proc(self, is_melee: bool = True) -> str:
+        """Human-readable summary of ``proc_damage()``."""
+        pct = self._MELEE_HP_PCT if is_melee else self._RANGED_HP_PCT
+        return f"{pct}% max HP as magic damage"
 
     def healing(self, champion_max_hp: float, is_melee: bool = True) -> Dict[str, Any]:
         """Calculate healing from proc.
@@ -235,7 +281,7 @@ class GraspOfTheUndying:
             Dict with heal amount
         """
         pct = 1.3 if is_melee else 0.52
-        heal = round(champion_max_hp * pct / 100, 2)
+        heal = champion_max_hp * pct / 100
         return {
             "heal": heal,
             "hp_pct": f"{pct}%",
@@ -259,7 +305,7 @@ class GraspOfTheUndying:
 # ─── MINOR RUNES (Precision Row 3 — Combat) ───
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class LastStand:
     """Last Stand (Precision, row 3 minor rune).
 
@@ -272,6 +318,8 @@ class LastStand:
         amp = ls.damage_amp(missing_hp_pct=70)  # -> 0.11 (max)
     """
     name: str = "Last Stand"
+    # Amp gained per 1% of current HP below 60% (5% → 11% over 30 points)
+    _AMP_PER_PCT = 0.06 / 30.0
 
     def damage_amp(self, missing_hp_pct: float) -> float:
         """Calculate damage amplification based on missing HP.
@@ -283,16 +331,14 @@ class LastStand:
         Returns:
             Damage amp as a decimal (0.05–0.11), or 0.0 if above 60% HP.
         """
-        current_hp_pct = 100.0 - max(0.0, min(missing_hp_pct, 100.0))
+        current_hp_pct = 100.0 - missing_hp_pct
         if current_hp_pct >= 60.0:
             return 0.0
-        if current_hp_pct <= 30.0:
-            return 0.11
-        # Linear interpolation: 5% at 60% HP → 11% at 30% HP
-        return round(0.05 + (60.0 - current_hp_pct) / 30.0 * 0.06, 4)
+        # Linear interpolation: 5% at 60% HP → 11% at 30% HP (capped)
+        return min(0.11, 0.05 + (60.0 - current_hp_pct) * self._AMP_PER_PCT)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CoupDeGrace:
     """Coup de Grace (Precision, row 3 minor rune).
 
@@ -313,10 +359,10 @@ class CoupDeGrace:
         Returns:
             0.08 if target is below 40% HP, else 0.0.
         """
-        return 0.08 if target_hp_pct < 40.0 else 0.0
+        return 0.08 * (target_hp_pct < 40.0)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CutDown:
     """Cut Down (Precision, row 3 minor rune).
 
@@ -328,6 +374,8 @@ class CutDown:
         amp = cd.damage_amp(target_max_hp=3000, your_max_hp=2000)  # -> 0.1
     """
     name: str = "Cut Down"
+    # Amp gained per 1% of extra target HP above 10% (5% → 15% over 90 points)
+    _AMP_PER_PCT = 0.10 / 90.0
 
     def damage_amp(self, target_max_hp: float, your_max_hp: float) -> float:
         """Calculate damage amp based on max HP difference.
@@ -344,6 +392,4 @@ class CutDown:
         diff_pct = (target_max_hp - your_max_hp) / your_max_hp * 100.0
         if diff_pct < 10.0:
             return 0.0
-        if diff_pct >= 100.0:
-            return 0.15
-        return round(0.05 + (diff_pct - 10.0) / 90.0 * 0.10, 4)
+        return min(0.15, 0.05 + (diff_pct - 10.0) * self._AMP_PER_PCT)
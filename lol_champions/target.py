@@ -1,12 +1,16 @@
 """Target class for damage calculation."""
 
+import functools
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Target:
     """Represents a damage target with defensive stats.
 
+    Immutable: build a new Target (or use ``dataclasses.replace``) to
+    change stats.
+
     Attributes:
         max_hp: Target's maximum health points
         armor: Total armor
@@ -18,12 +22,18 @@ class Target:
 
     @classmethod
     def from_champion(cls, champion) -> 'Target':
-        """Create a Target from any Champion instance."""
-        return cls(
-            max_hp=champion.total_HP,
-            armor=champion.total_AR,
-            mr=champion.total_MR,
-        )
+        """Create a Target from any Champion instance.
+
+        Targets are immutable, so one instance is shared per distinct
+        (HP, armor, MR).
+        """
+        return _target_from_stats(cls, champion.total_HP, champion.total_AR,
+                                  champion.total_MR)
 
     def __str__(self) -> str:
         return f"Target(HP: {self.max_hp}, Armor: {self.armor}, MR: {self.mr})"
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _target_from_stats(cls, max_hp: float, armor: float, mr: float) -> Target:
+    return cls(max_hp=max_hp, armor=armor, mr=mr)
@@ -1,6 +1,11 @@
 from dataclasses import dataclass, field
 from typing import List
 
+# Fiora R tables by rank (index 0 = rank 1)
+_R_COOLDOWNS = (110, 90, 70)
+_R_HEAL_BASES = (375, 500, 625)
+_R_BONUS_AD_RATIO = 3.0
+
 @dataclass
 class Champion:
     base_AD: float
@@ -185,15 +190,11 @@ class Fiora(Champion):
         if self.R_ability.current_level == 0:
             return {"error": "Ability not learned yet"}
         
-        cooldowns = [110, 90, 70]
-        max_heal_bases = [375,500,625]
-        bonus_ad_ratio = 3.0
-        
         level = self.R_ability.current_level - 1
-        max_heal = max_heal_bases[level] + (self.bonus_AD * bonus_ad_ratio)
+        max_heal = _R_HEAL_BASES[level] + (self.bonus_AD * _R_BONUS_AD_RATIO)
         return {
-            "cooldown": cooldowns[level],
-            "heal_per_tick": max_heal[level],
+            "cooldown": _R_COOLDOWNS[level],
+            "heal_per_tick": round(max_heal, 2),
             "heal_bonus_ad_ratio": "15% bonus AD"
         }
     